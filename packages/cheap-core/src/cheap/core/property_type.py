@@ -5,9 +5,14 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Final, Literal, TypeAlias
+from typing import TYPE_CHECKING, Any, Final, Literal, TypeAlias, TypeVar
 from uuid import UUID
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_T = TypeVar("_T")
+
 # Type aliases for property values
 PropertyValue: TypeAlias = int | float | bool | str | Decimal | datetime | UUID | bytes | None
 
@@ -177,6 +182,23 @@ class PropertyType(Enum):
         raise TypeError(f"Cannot infer PropertyType from value of type {type(value)}")
 
 
+def key_by_value(mapping: Mapping[PropertyType, _T]) -> dict[str, _T]:
+    """
+    Re-key a PropertyType mapping by each member's plain string value.
+
+    For hot-path lookups, indexed with ``property_type._value_``: hashing a str
+    is much cheaper than hashing an Enum member, whose __hash__ is implemented
+    in Python.
+
+    Args:
+        mapping: Mapping keyed by PropertyType.
+
+    Returns:
+        A new dict with the same values, keyed by enum value.
+    """
+    return {prop_type._value_: value for prop_type, value in mapping.items()}
+
+
 # Type alias for property type literals
 PropertyTypeLiteral: TypeAlias = Literal[
     "INTEGER",
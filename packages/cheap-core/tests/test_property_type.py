@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from cheap.core.property_type import PropertyType
+from cheap.core.property_type import PropertyType, key_by_value
 
 
 class TestPropertyType:
@@ -188,3 +188,10 @@ class TestPropertyType:
 
         with pytest.raises(TypeError, match="Cannot infer PropertyType"):
             PropertyType.from_value({"key": "value"})
+
+    def test_key_by_value(self) -> None:
+        """Test re-keying a PropertyType mapping by enum value."""
+        by_value = key_by_value({PropertyType.INTEGER: "INT", PropertyType.BLOB: "BLB"})
+
+        assert by_value == {"INTEGER": "INT", "BLOB": "BLB"}
+        assert by_value[PropertyType.BLOB._value_] == "BLB"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Self
 
 import aiomysql
@@ -15,6 +17,18 @@ class MariaDbAdapter:
     Supports both connection pooling (production) and standalone connections (development/testing).
     """
 
+    __slots__ = (
+        "host",
+        "port",
+        "db",
+        "user",
+        "password",
+        "charset",
+        "unix_socket",
+        "_pool",
+        "_standalone_conn",
+    )
+
     def __init__(
         self,
         host: str = "localhost",
@@ -23,6 +37,7 @@ class MariaDbAdapter:
         user: str = "cheap_user",
         password: str = "",
         charset: str = "utf8mb4",
+        unix_socket: str | None = None,
     ) -> None:
         """Initialize the adapter (does not connect).
 
@@ -33,6 +48,7 @@ class MariaDbAdapter:
             user: Database user
             password: Database password
             charset: Character set (default: utf8mb4)
+            unix_socket: Path to the server's unix socket; when set, host and port are ignored
         """
         self.host = host
         self.port = port
@@ -40,6 +56,7 @@ class MariaDbAdapter:
         self.user = user
         self.password = password
         self.charset = charset
+        self.unix_socket = unix_socket
         self._pool: aiomysql.Pool | None = None
         self._standalone_conn: aiomysql.Connection | None = None
 
@@ -52,6 +69,7 @@ class MariaDbAdapter:
         user: str = "cheap_user",
         password: str = "",
         charset: str = "utf8mb4",
+        unix_socket: str | None = None,
         *,
         pool_size: int | None = None,
         min_size: int | None = None,
@@ -68,6 +86,8 @@ class MariaDbAdapter:
             user: Database user
             password: Database password
             charset: Character set (default: utf8mb4)
+            unix_socket: Path to the server's unix socket. Preferred for local servers,
+                as it bypasses the TCP stack (TCP connections already use TCP_NODELAY).
             pool_size: Maximum pool size (None = standalone connection)
             min_size: Minimum pool size (default: 5)
             init_schema: If True, create schema on first connect
@@ -77,7 +97,7 @@ class MariaDbAdapter:
         Returns:
             Connected adapter instance
         """
-        adapter = cls(host, port, db, user, password, charset)
+        adapter = cls(host, port, db, user, password, charset, unix_socket)
 
         # Create pool or standalone connection
         if pool_size is not None:
@@ -89,6 +109,7 @@ class MariaDbAdapter:
                 user=user,
                 password=password,
                 charset=charset,
+                unix_socket=unix_socket,
                 minsize=min_size or 5,
                 maxsize=pool_size,
                 autocommit=False,
@@ -102,6 +123,7 @@ class MariaDbAdapter:
                 user=user,
                 password=password,
                 charset=charset,
+                unix_socket=unix_socket,
                 autocommit=False,
             )
 
@@ -176,6 +198,25 @@ class MariaDbAdapter:
         """
         return await self.get_connection()
 
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiomysql.Connection]:
+        """Hold one connection for the duration of a block.
+
+        The connection is taken once, shared by every operation in the block,
+        and returned when the block exits, also on error.
+
+        Yields:
+            Active database connection
+
+        Raises:
+            RuntimeError: If not connected to database
+        """
+        conn = await self.get_connection()
+        try:
+            yield conn
+        finally:
+            await self.return_connection(conn)
+
     async def close(self) -> None:
         """Close all connections and clean up resources."""
         if self._pool is not None:
@@ -199,4 +240,5 @@ class MariaDbAdapter:
         """String representation of the adapter."""
         status = "connected" if self.is_connected else "disconnected"
         mode = "pooled" if self.has_pool else "standalone"
-        return f"MariaDbAdapter({self.db}@{self.host}:{self.port}, {mode}, {status})"
+        location = self.unix_socket or f"{self.host}:{self.port}"
+        return f"MariaDbAdapter({self.db}@{location}, {mode}, {status})"
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+from uuid import UUID, uuid4
 
 from cheap.core.aspect import AspectDef
 from cheap.core.aspect_impl import AspectDefImpl
@@ -11,32 +14,41 @@ from cheap.core.catalog_impl import CatalogImpl
 from cheap.core.catalog_species import CatalogSpecies
 from cheap.core.property import PropertyDef
 from cheap.core.property_impl import PropertyDefImpl
-from cheap.core.property_type import PropertyType
+from cheap.core.property_type import PropertyType, key_by_value
 from cheap.db.mariadb.adapter import MariaDbAdapter
 
-# Property type mapping to database abbreviations
-PROPERTY_TYPE_TO_DB = {
-    PropertyType.INTEGER: "INT",
-    PropertyType.FLOAT: "FLT",
-    PropertyType.BOOLEAN: "BLN",
-    PropertyType.STRING: "STR",
-    PropertyType.TEXT: "TXT",
-    PropertyType.BIG_INTEGER: "BGI",
-    PropertyType.BIG_DECIMAL: "BGF",
-    PropertyType.DATE_TIME: "DAT",
-    PropertyType.URI: "URI",
-    PropertyType.UUID: "UID",
-    PropertyType.CLOB: "CLB",
-    PropertyType.BLOB: "BLB",
-}
-
-# Reverse mapping from database abbreviations to PropertyType
-DB_TO_PROPERTY_TYPE = {v: k for k, v in PROPERTY_TYPE_TO_DB.items()}
+# Property type mapping: PropertyType -> MariaDB type abbreviation (read-only)
+PROPERTY_TYPE_TO_DB: Final[Mapping[PropertyType, str]] = MappingProxyType(
+    {
+        PropertyType.INTEGER: "INT",
+        PropertyType.FLOAT: "FLT",
+        PropertyType.BOOLEAN: "BLN",
+        PropertyType.STRING: "STR",
+        PropertyType.TEXT: "TXT",
+        PropertyType.BIG_INTEGER: "BGI",
+        PropertyType.BIG_DECIMAL: "BGF",
+        PropertyType.DATE_TIME: "DAT",
+        PropertyType.URI: "URI",
+        PropertyType.UUID: "UID",
+        PropertyType.CLOB: "CLB",
+        PropertyType.BLOB: "BLB",
+    }
+)
+
+# Reverse mapping: MariaDB type abbreviation -> PropertyType (read-only)
+DB_TO_PROPERTY_TYPE: Final[Mapping[str, PropertyType]] = MappingProxyType(
+    {v: k for k, v in PROPERTY_TYPE_TO_DB.items()}
+)
+
+# Hot-path lookup keyed by enum value (see key_by_value)
+_DB_CODE_BY_VALUE: Final[dict[str, str]] = key_by_value(PROPERTY_TYPE_TO_DB)
 
 
 class MariaDbDao:
     """Data Access Object for persisting catalogs to MariaDB/MySQL."""
 
+    __slots__ = ("_adapter",)
+
     def __init__(self, adapter: MariaDbAdapter) -> None:
         """Initialize the DAO with a database adapter.
 
@@ -53,13 +65,25 @@ class MariaDbDao:
         """
         conn = await self._adapter.get_connection()
         try:
+            # One explicit transaction per save, so the redo log is synced once on commit
+            await conn.begin()
+
             # Save catalog metadata
             await self._save_catalog_metadata(conn, catalog)
 
-            # Save aspect definitions
+            # Save aspect definitions, collecting their property definitions
             aspect_defs = getattr(catalog, "_aspect_defs", {})
+            property_rows: list[tuple[Any, ...]] = []
             for aspect_def in aspect_defs.values():
-                await self._save_aspect_def(conn, catalog, aspect_def)
+                aspect_def_id = await self._save_aspect_def(conn, catalog, aspect_def)
+                properties = getattr(aspect_def, "properties", {})
+                for idx, (prop_name, prop_def) in enumerate(properties.items()):
+                    property_rows.append(
+                        self._property_def_row(aspect_def_id, idx, prop_name, prop_def)
+                    )
+
+            # Save all property definitions in one multi-row INSERT
+            await self._save_property_defs(conn, property_rows)
 
             await conn.commit()
         except Exception:
@@ -114,6 +138,8 @@ class MariaDbDao:
 
             return catalog
         finally:
+            # End the implicit read transaction; the pool discards connections left in one
+            await conn.rollback()
             await self._adapter.return_connection(conn)
 
     async def delete_catalog(self, catalog_id: UUID) -> None:
@@ -124,6 +150,7 @@ class MariaDbDao:
         """
         conn = await self._adapter.get_connection()
         try:
+            await conn.begin()
             async with conn.cursor() as cur:
                 await cur.execute(
                     "DELETE FROM catalog WHERE catalog_id = %s",
@@ -164,13 +191,17 @@ class MariaDbDao:
 
     async def _save_aspect_def(  # type: ignore[no-untyped-def]
         self, conn, catalog: Catalog, aspect_def: AspectDef
-    ) -> None:
-        """Save an aspect definition to the database."""
+    ) -> UUID:
+        """Save an aspect definition to the database.
+
+        Property definitions are not saved here; see _save_property_defs.
+
+        Returns:
+            The aspect definition's database ID
+        """
         aspect_def_id = getattr(aspect_def, "_id", None)
         if aspect_def_id is None:
             # Generate ID if not present
-            from uuid import uuid4
-
             aspect_def_id = uuid4()
             object.__setattr__(aspect_def, "_id", aspect_def_id)
 
@@ -212,19 +243,39 @@ class MariaDbDao:
                 (str(catalog.global_id), str(aspect_def_id)),
             )
 
-        # Save property definitions
-        properties = getattr(aspect_def, "properties", {})
-        for idx, (prop_name, prop_def) in enumerate(properties.items()):
-            await self._save_property_def(conn, aspect_def_id, idx, prop_name, prop_def)
-
-    async def _save_property_def(  # type: ignore[no-untyped-def]
-        self, conn, aspect_def_id: UUID, index: int, name: str, prop_def: PropertyDef
+        return aspect_def_id
+
+    @staticmethod
+    def _property_def_row(
+        aspect_def_id: UUID, index: int, name: str, prop_def: PropertyDef
+    ) -> tuple[Any, ...]:
+        """Build the property_def parameter row for a property definition."""
+        return (
+            str(aspect_def_id),
+            name,
+            index,
+            _DB_CODE_BY_VALUE[prop_def.property_type._value_],
+            None,  # default_value not yet implemented
+            False,  # has_default_value
+            True,  # is_readable
+            True,  # is_writable
+            prop_def.is_nullable,
+            False,  # is_multivalued not yet implemented
+        )
+
+    async def _save_property_defs(  # type: ignore[no-untyped-def]
+        self, conn, rows: list[tuple[Any, ...]]
     ) -> None:
-        """Save a property definition to the database."""
-        db_type = PROPERTY_TYPE_TO_DB[prop_def.property_type]
+        """Save property definitions to the database in a single batch.
+
+        aiomysql rewrites executemany() of an INSERT ... VALUES statement into one
+        multi-row INSERT, so the whole batch costs a single round-trip.
+        """
+        if not rows:
+            return
 
         async with conn.cursor() as cur:
-            await cur.execute(
+            await cur.executemany(
                 """
                 INSERT INTO property_def (aspect_def_id, name, property_index, property_type,
                                          default_value, has_default_value,
@@ -240,18 +291,7 @@ class MariaDbDao:
                     is_nullable = VALUES(is_nullable),
                     is_multivalued = VALUES(is_multivalued)
                 """,
-                (
-                    str(aspect_def_id),
-                    name,
-                    index,
-                    db_type,
-                    None,  # default_value not yet implemented
-                    False,  # has_default_value
-                    True,  # is_readable
-                    True,  # is_writable
-                    prop_def.is_nullable,
-                    False,  # is_multivalued not yet implemented
-                ),
+                rows,
             )
 
     async def _load_aspect_defs(  # type: ignore[no-untyped-def]
@@ -33,9 +33,9 @@ pytestmark = pytest.mark.skipif(
 class TestMariaDbDao:
     """Test suite for MariaDbDao catalog persistence."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     async def adapter(self) -> AsyncGenerator[MariaDbAdapter, None]:
-        """Create an adapter with schema."""
+        """Create an adapter with schema, shared by all tests in the session."""
         adapter = await MariaDbAdapter.create(
             host=MARIADB_HOST,
             port=MARIADB_PORT,
@@ -44,15 +44,16 @@ class TestMariaDbDao:
             password=MARIADB_PASSWORD,
             init_schema=True,
         )
+        yield adapter
+        await adapter.close()
 
-        # Clean any existing data
+    @pytest.fixture(autouse=True)
+    async def clean_data(self, adapter: MariaDbAdapter) -> None:
+        """Clean any existing data before each test."""
         conn = await adapter.get_connection()
         await MariaDbSchema.truncate_data(conn)
         await adapter.return_connection(conn)
 
-        yield adapter
-        await adapter.close()
-
     @pytest.fixture
     def dao(self, adapter: MariaDbAdapter) -> MariaDbDao:
         """Create a DAO instance."""
@@ -139,6 +140,32 @@ class TestMariaDbDao:
         assert loaded_age_prop.property_type == PropertyType.INTEGER
         assert not loaded_age_prop.is_nullable
 
+    @pytest.mark.asyncio
+    async def test_save_catalog_with_many_properties(
+        self, adapter: MariaDbAdapter, dao: MariaDbDao
+    ) -> None:
+        """Test that a batch of 100 property definitions is saved and loaded in order."""
+        catalog_id = uuid4()
+        catalog = CatalogImpl(
+            global_id=catalog_id,
+            species=CatalogSpecies.SOURCE,
+            version="1.0.0",
+        )
+
+        properties = {
+            f"prop_{i:03d}": PropertyDefImpl(
+                name=f"prop_{i:03d}", property_type=PropertyType.STRING
+            )
+            for i in range(100)
+        }
+        catalog.add_aspect_def(AspectDefImpl(name="wide", properties=properties))
+
+        await dao.save_catalog(catalog)
+
+        loaded = await dao.load_catalog(catalog_id)
+        loaded_props = loaded.aspect_defs["wide"].properties
+        assert list(loaded_props) == list(properties)
+
     @pytest.mark.asyncio
     async def test_delete_catalog(self, adapter: MariaDbAdapter, dao: MariaDbDao) -> None:
         """Test deleting a catalog."""
@@ -199,6 +226,12 @@ class TestMariaDbDao:
         for prop_type in all_types:
             assert prop_type in PROPERTY_TYPE_TO_DB
 
+        # Both mappings are read-only
+        with pytest.raises(TypeError):
+            PROPERTY_TYPE_TO_DB[PropertyType.INTEGER] = "XXX"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            DB_TO_PROPERTY_TYPE["XXX"] = PropertyType.INTEGER  # type: ignore[index]
+
     @pytest.mark.asyncio
     async def test_upsert_catalog(self, adapter: MariaDbAdapter, dao: MariaDbDao) -> None:
         """Test that saving the same catalog twice uses upsert."""
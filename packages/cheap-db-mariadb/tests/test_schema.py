@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 
 import aiomysql
 import pytest
@@ -23,6 +24,15 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+async def fetch_all(
+    conn: aiomysql.Connection, sql: str, params: tuple[Any, ...] | None = None
+) -> list[tuple[Any, ...]]:
+    """Run a query on a single cursor and return all rows."""
+    async with conn.cursor() as cur:
+        await cur.execute(sql, params)
+        return list(await cur.fetchall())
+
+
 class TestMariaDbSchema:
     """Test suite for MariaDB schema operations."""
 
@@ -51,34 +61,36 @@ class TestMariaDbSchema:
             assert await MariaDbSchema.schema_exists(conn)
 
             # Verify key tables exist
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    """
-                    SELECT table_name FROM information_schema.tables
-                    WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE'
-                    ORDER BY table_name
-                    """
-                )
-                rows = await cur.fetchall()
-                tables = [row[0] for row in rows]
-
-            expected_tables = [
-                "aspect",
-                "aspect_def",
-                "catalog",
-                "catalog_aspect_def",
-                "hierarchy",
-                "hierarchy_aspect_map",
-                "hierarchy_entity_directory",
-                "hierarchy_entity_list",
-                "hierarchy_entity_set",
-                "hierarchy_entity_tree_node",
-                "property_def",
-                "property_value",
-            ]
-
-            for table in expected_tables:
-                assert table in tables, f"Table {table} not found"
+            rows = await fetch_all(
+                conn,
+                """
+                SELECT table_name FROM information_schema.tables
+                WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE'
+                ORDER BY table_name
+                """,
+            )
+            tables = {row[0] for row in rows}
+
+            expected_tables = frozenset(
+                {
+                    "aspect",
+                    "aspect_def",
+                    "catalog",
+                    "catalog_aspect_def",
+                    "hierarchy",
+                    "hierarchy_aspect_map",
+                    "hierarchy_entity_directory",
+                    "hierarchy_entity_list",
+                    "hierarchy_entity_set",
+                    "hierarchy_entity_tree_node",
+                    "property_def",
+                    "property_value",
+                }
+            )
+
+            assert expected_tables <= tables, (
+                f"Tables not found: {sorted(expected_tables - tables)}"
+            )
 
             await adapter.return_connection(conn)
 
@@ -98,20 +110,21 @@ class TestMariaDbSchema:
             await MariaDbSchema.drop_schema(conn)
             await MariaDbSchema.create_schema(conn, include_audit=True, include_foreign_keys=False)
 
-            # Check that audit columns exist in aspect_def
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    """
-                    SELECT column_name FROM information_schema.columns
-                    WHERE table_schema = DATABASE() AND table_name = 'aspect_def'
-                    ORDER BY column_name
-                    """
-                )
-                rows = await cur.fetchall()
-                columns = [row[0] for row in rows]
-
-            assert "created_at" in columns
-            assert "updated_at" in columns
+            # Check audit columns on all tables with a single query
+            rows = await fetch_all(
+                conn,
+                """
+                SELECT table_name, column_name FROM information_schema.columns
+                WHERE table_schema = DATABASE()
+                  AND column_name IN ('created_at', 'updated_at')
+                """,
+            )
+            audit_columns = {(row[0], row[1]) for row in rows}
+
+            assert ("aspect_def", "created_at") in audit_columns
+            assert ("aspect_def", "updated_at") in audit_columns
+            assert ("catalog", "updated_at") in audit_columns
+            assert ("hierarchy_entity_list", "created_at") in audit_columns
 
             await adapter.return_connection(conn)
 
@@ -164,12 +177,8 @@ class TestMariaDbSchema:
             await conn.commit()
 
             # Verify data exists
-            async with conn.cursor() as cur:
-                await cur.execute("SELECT COUNT(*) FROM aspect_def")
-                row = await cur.fetchone()
-                count = row[0] if row else 0
-
-            assert count == 1
+            rows = await fetch_all(conn, "SELECT COUNT(*) FROM aspect_def")
+            assert rows[0][0] == 1
 
             # Truncate data
             await MariaDbSchema.truncate_data(conn)
@@ -177,12 +186,8 @@ class TestMariaDbSchema:
             # Verify data is gone but schema remains
             assert await MariaDbSchema.schema_exists(conn)
 
-            async with conn.cursor() as cur:
-                await cur.execute("SELECT COUNT(*) FROM aspect_def")
-                row = await cur.fetchone()
-                count = row[0] if row else 0
-
-            assert count == 0
+            rows = await fetch_all(conn, "SELECT COUNT(*) FROM aspect_def")
+            assert rows[0][0] == 0
 
             await adapter.return_connection(conn)
 
@@ -2,21 +2,44 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Self
+from weakref import WeakKeyDictionary
 
 import psycopg
+from psycopg.conninfo import make_conninfo
 from psycopg_pool import AsyncConnectionPool
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from psycopg.rows import TupleRow
 
+# Default number of acquisitions after which a pooled connection is replaced
+DEFAULT_MAX_QUERIES = 50_000
+
+# Number of prepared statements psycopg keeps per connection (its default is 100)
+PREPARED_STATEMENT_CACHE_SIZE = 1024
+
+# Executions after which psycopg prepares a statement on the server (its default
+# is 5), so the DAO's executemany upserts are prepared after a few rows
+PREPARE_THRESHOLD = 3
+
+
+async def _configure_connection(conn: psycopg.AsyncConnection[TupleRow]) -> None:
+    """Apply per-connection client settings to a newly opened connection."""
+    conn.prepared_max = PREPARED_STATEMENT_CACHE_SIZE
+    conn.prepare_threshold = PREPARE_THRESHOLD
+
 
 class PostgresAdapter:
     """
     PostgreSQL database connection adapter with async support and pooling.
 
     Manages async PostgreSQL database connections with connection pooling
-    for production deployments. Automatically sets timezone to UTC.
+    for production deployments. Sessions use the UTC timezone and UTF-8 client
+    encoding, applied as startup options so no extra round-trip is needed per
+    connection.
 
     Example:
         ```python
@@ -39,10 +62,13 @@ class PostgresAdapter:
         ```
     """
 
+    __slots__ = ("_conninfo", "_pool", "_max_queries", "_query_counts", "_standalone_conn")
+
     def __init__(
         self,
         conninfo: str,
         pool: AsyncConnectionPool | None = None,
+        max_queries: int = DEFAULT_MAX_QUERIES,
     ) -> None:
         """
         Initialize adapter (use create() instead).
@@ -50,9 +76,18 @@ class PostgresAdapter:
         Args:
             conninfo: PostgreSQL connection string.
             pool: Optional connection pool.
+            max_queries: Number of times a pooled connection may be acquired
+                before it is closed and replaced; counted by the pool's check
+                callback, which create() sets to _check_connection.
         """
         self._conninfo = conninfo
         self._pool = pool
+        self._max_queries = max_queries
+        # Checkouts per pooled connection; entries go away with connections
+        # the pool discards, so a new connection never inherits a count
+        self._query_counts: WeakKeyDictionary[psycopg.AsyncConnection[TupleRow], int] = (
+            WeakKeyDictionary()
+        )
         self._standalone_conn: psycopg.AsyncConnection[TupleRow] | None = None
 
     @classmethod
@@ -68,12 +103,15 @@ class PostgresAdapter:
         min_size: int | None = None,
         init_schema: bool = False,
         include_audit: bool = False,
+        unlogged: bool = False,
+        max_queries: int = DEFAULT_MAX_QUERIES,
     ) -> Self:
         """
         Create and initialize a PostgreSQL adapter.
 
         Args:
-            host: Database host.
+            host: Database host. A value starting with "/" is a unix socket directory
+                (e.g. "/var/run/postgresql"), which skips the TCP stack for local servers.
             port: Database port.
             dbname: Database name.
             user: Database user.
@@ -82,6 +120,10 @@ class PostgresAdapter:
             min_size: Minimum pool size.
             init_schema: If True, initialize the CHEAP schema.
             include_audit: If True and init_schema is True, include audit tables.
+            unlogged: If True and init_schema is True, create the tables UNLOGGED
+                (no WAL, not crash-safe); intended for tests and caches.
+            max_queries: Number of times a pooled connection may be acquired before
+                it is replaced, bounding server-side state held by long-lived connections.
 
         Returns:
             Initialized PostgresAdapter.
@@ -106,30 +148,47 @@ class PostgresAdapter:
             )
             ```
         """
-        # Build connection string
-        conninfo = f"host={host} port={port} dbname={dbname} user={user}"
-        if password:
-            conninfo += f" password={password}"
+        # Build connection string; TimeZone, the UTF-8 client encoding and
+        # disabling JIT (only overhead for the DAO's short queries) are applied
+        # by the backend at startup.
+        # libpq already sets TCP_NODELAY; keepalives detect dead TCP peers and are
+        # ignored for unix sockets.
+        conninfo = make_conninfo(
+            host=host,
+            port=port,
+            dbname=dbname,
+            user=user,
+            password=password or None,
+            options="-c TimeZone=UTC -c jit=off",
+            client_encoding="UTF8",
+            application_name="cheap",
+            keepalives=1,
+            keepalives_idle=60,
+        )
 
-        # Create pool if requested
-        pool = None
+        adapter = cls(conninfo, max_queries=max_queries)
+
+        # Create pool if requested; every checkout, through get_connection()
+        # or connection(), passes the check that retires worn connections
         if pool_size is not None:
-            pool = AsyncConnectionPool(
+            adapter._pool = AsyncConnectionPool(
                 conninfo,
                 min_size=min_size or 5,
                 max_size=pool_size,
+                configure=_configure_connection,
+                check=adapter._check_connection,
                 open=False,
             )
-            await pool.open()
-
-        adapter = cls(conninfo, pool)
+            await adapter._pool.open()
 
         # Initialize schema if requested
         if init_schema:
             from cheap.db.postgres.schema import PostgresSchema
 
-            async with adapter.connection() as conn:
-                await PostgresSchema.create_schema(conn, include_audit=include_audit)
+            async with adapter.acquire() as conn:
+                await PostgresSchema.create_schema(
+                    conn, include_audit=include_audit, unlogged=unlogged
+                )
 
         return adapter
 
@@ -154,9 +213,7 @@ class PostgresAdapter:
             # Create standalone connection if not pooled
             if self._standalone_conn is None:
                 self._standalone_conn = await psycopg.AsyncConnection.connect(self._conninfo)
-                # Set timezone to UTC
-                async with self._standalone_conn.cursor() as cur:
-                    await cur.execute("SET TIME ZONE 'UTC'")
+                await _configure_connection(self._standalone_conn)
             return self._standalone_conn
 
     async def get_connection(self) -> psycopg.AsyncConnection[TupleRow]:
@@ -170,18 +227,12 @@ class PostgresAdapter:
         """
         if self._pool is not None:
             # Get connection from pool
-            conn = await self._pool.getconn()
-            # Set timezone to UTC
-            async with conn.cursor() as cur:
-                await cur.execute("SET TIME ZONE 'UTC'")
-            return conn
+            return await self._pool.getconn()
         else:
             # Use standalone connection
             if self._standalone_conn is None:
                 self._standalone_conn = await psycopg.AsyncConnection.connect(self._conninfo)
-                # Set timezone to UTC
-                async with self._standalone_conn.cursor() as cur:
-                    await cur.execute("SET TIME ZONE 'UTC'")
+                await _configure_connection(self._standalone_conn)
             return self._standalone_conn
 
     async def return_connection(self, conn: psycopg.AsyncConnection[TupleRow]) -> None:
@@ -194,10 +245,50 @@ class PostgresAdapter:
         if self._pool is not None:
             await self._pool.putconn(conn)
 
+    async def _check_connection(self, conn: psycopg.AsyncConnection[TupleRow]) -> None:
+        """
+        Count a checkout of a pooled connection, retiring it after max_queries.
+
+        Raises:
+            psycopg.OperationalError: If the connection has been used up; it
+                is closed first, so the pool discards it, opens a replacement
+                and hands out another connection instead.
+        """
+        uses = self._query_counts.get(conn, 0) + 1
+        if uses > self._max_queries:
+            del self._query_counts[conn]
+            await conn.close()
+            raise psycopg.OperationalError("connection reached max_queries")
+        self._query_counts[conn] = uses
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[psycopg.AsyncConnection[TupleRow]]:
+        """
+        Hold one connection for the duration of a block.
+
+        The connection is taken once, shared by every operation in the block,
+        and returned when the block exits, also on error.
+
+        Yields:
+            Active database connection.
+
+        Example:
+            ```python
+            async with adapter.acquire() as conn:
+                await PostgresSchema.truncate_data(conn)
+            ```
+        """
+        conn = await self.get_connection()
+        try:
+            yield conn
+        finally:
+            await self.return_connection(conn)
+
     async def close(self) -> None:
         """Close all connections and pool."""
         if self._pool is not None:
             await self._pool.close()
+            self._query_counts.clear()
         if self._standalone_conn is not None:
             await self._standalone_conn.close()
             self._standalone_conn = None
@@ -212,6 +303,11 @@ class PostgresAdapter:
         """Check if using connection pooling."""
         return self._pool is not None
 
+    @property
+    def pool_size(self) -> int:
+        """Get the maximum number of connections available (1 when standalone)."""
+        return self._pool.max_size if self._pool is not None else 1
+
     @property
     def is_connected(self) -> bool:
         """Check if currently connected."""
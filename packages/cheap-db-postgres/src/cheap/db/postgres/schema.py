@@ -2,428 +2,282 @@
 
 from __future__ import annotations
 
+import functools
+import importlib.resources
 from typing import TYPE_CHECKING
 
+from psycopg import pq
+
 if TYPE_CHECKING:
     import psycopg
 
 
-# Main schema DDL - ported from postgres-cheap.sql
-SCHEMA_DDL = """
--- Enable UUID extension
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
-
--- Aspect Definition Table
-CREATE TABLE IF NOT EXISTS aspect_def (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    name VARCHAR(255) NOT NULL UNIQUE,
-    is_readable BOOLEAN NOT NULL DEFAULT TRUE,
-    is_writable BOOLEAN NOT NULL DEFAULT TRUE,
-    can_add_properties BOOLEAN NOT NULL DEFAULT FALSE,
-    can_remove_properties BOOLEAN NOT NULL DEFAULT FALSE
-);
-
-CREATE INDEX IF NOT EXISTS idx_aspect_def_name ON aspect_def(name);
-
--- Property Definition Table
-CREATE TABLE IF NOT EXISTS property_def (
-    id BIGSERIAL PRIMARY KEY,
-    aspect_def_id UUID NOT NULL,
-    name VARCHAR(255) NOT NULL,
-    type VARCHAR(3) NOT NULL CHECK (type IN ('INT', 'FLT', 'BLN', 'STR', 'TXT', 'BGI', 'BGF', 'DAT', 'URI', 'UID', 'CLB', 'BLB')),
-    is_writable BOOLEAN NOT NULL DEFAULT TRUE,
-    is_nullable BOOLEAN NOT NULL DEFAULT TRUE,
-    is_multivalued BOOLEAN NOT NULL DEFAULT FALSE,
-    default_value TEXT,
-    FOREIGN KEY (aspect_def_id) REFERENCES aspect_def(id) ON DELETE CASCADE,
-    UNIQUE (aspect_def_id, name)
-);
-
-CREATE INDEX IF NOT EXISTS idx_property_def_aspect_def ON property_def(aspect_def_id);
-CREATE INDEX IF NOT EXISTS idx_property_def_name ON property_def(aspect_def_id, name);
-
--- Catalog Table
-CREATE TABLE IF NOT EXISTS catalog (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    species VARCHAR(10) NOT NULL CHECK (species IN ('SOURCE', 'SINK', 'MIRROR', 'CACHE', 'CLONE', 'FORK')),
-    version VARCHAR(255) NOT NULL
-);
-
-CREATE INDEX IF NOT EXISTS idx_catalog_species ON catalog(species);
-
--- Catalog-AspectDef Link Table
-CREATE TABLE IF NOT EXISTS catalog_aspect_def (
-    catalog_id UUID NOT NULL,
-    aspect_def_id UUID NOT NULL,
-    FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
-    FOREIGN KEY (aspect_def_id) REFERENCES aspect_def(id) ON DELETE CASCADE,
-    PRIMARY KEY (catalog_id, aspect_def_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_catalog_aspect_def_catalog ON catalog_aspect_def(catalog_id);
-CREATE INDEX IF NOT EXISTS idx_catalog_aspect_def_aspect ON catalog_aspect_def(aspect_def_id);
-
--- Hierarchy Definition Table
-CREATE TABLE IF NOT EXISTS hierarchy_def (
-    id BIGSERIAL PRIMARY KEY,
-    catalog_id UUID NOT NULL,
-    name VARCHAR(255) NOT NULL,
-    type VARCHAR(2) NOT NULL CHECK (type IN ('EL', 'ES', 'ED', 'ET', 'AM')),
-    FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
-    UNIQUE (catalog_id, name)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hierarchy_def_catalog ON hierarchy_def(catalog_id);
-CREATE INDEX IF NOT EXISTS idx_hierarchy_def_name ON hierarchy_def(catalog_id, name);
-
--- Entity Table
-CREATE TABLE IF NOT EXISTS entity (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    catalog_id UUID NOT NULL,
-    FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE
-);
-
-CREATE INDEX IF NOT EXISTS idx_entity_catalog ON entity(catalog_id);
-
--- Hierarchy Table
-CREATE TABLE IF NOT EXISTS hierarchy (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    catalog_id UUID NOT NULL,
-    hierarchy_def_id BIGINT NOT NULL,
-    version INTEGER NOT NULL DEFAULT 1,
-    FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
-    FOREIGN KEY (hierarchy_def_id) REFERENCES hierarchy_def(id) ON DELETE CASCADE
-);
-
-CREATE INDEX IF NOT EXISTS idx_hierarchy_catalog ON hierarchy(catalog_id);
-CREATE INDEX IF NOT EXISTS idx_hierarchy_def ON hierarchy(hierarchy_def_id);
-
--- Aspect Table
-CREATE TABLE IF NOT EXISTS aspect (
-    id BIGSERIAL PRIMARY KEY,
-    entity_id UUID NOT NULL,
-    aspect_def_id UUID NOT NULL,
-    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
-    FOREIGN KEY (aspect_def_id) REFERENCES aspect_def(id) ON DELETE CASCADE,
-    UNIQUE (entity_id, aspect_def_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_aspect_entity ON aspect(entity_id);
-CREATE INDEX IF NOT EXISTS idx_aspect_def ON aspect(aspect_def_id);
-
--- Property Value Table
-CREATE TABLE IF NOT EXISTS property_value (
-    id BIGSERIAL PRIMARY KEY,
-    aspect_id BIGINT NOT NULL,
-    property_def_id BIGINT NOT NULL,
-    value_index INTEGER NOT NULL DEFAULT 0,
-    value_text TEXT,
-    value_binary BYTEA,
-    FOREIGN KEY (aspect_id) REFERENCES aspect(id) ON DELETE CASCADE,
-    FOREIGN KEY (property_def_id) REFERENCES property_def(id) ON DELETE CASCADE
-);
-
-CREATE INDEX IF NOT EXISTS idx_property_value_aspect ON property_value(aspect_id);
-CREATE INDEX IF NOT EXISTS idx_property_value_property_def ON property_value(property_def_id);
-CREATE INDEX IF NOT EXISTS idx_property_value_aspect_property ON property_value(aspect_id, property_def_id);
-
--- Hierarchy Content: Entity List
-CREATE TABLE IF NOT EXISTS hierarchy_entity_list (
-    hierarchy_id UUID NOT NULL,
-    entity_id UUID NOT NULL,
-    position INTEGER NOT NULL,
-    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
-    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
-    PRIMARY KEY (hierarchy_id, position)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hel_hierarchy ON hierarchy_entity_list(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_hel_entity ON hierarchy_entity_list(entity_id);
-
--- Hierarchy Content: Entity Set
-CREATE TABLE IF NOT EXISTS hierarchy_entity_set (
-    hierarchy_id UUID NOT NULL,
-    entity_id UUID NOT NULL,
-    position INTEGER,
-    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
-    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
-    PRIMARY KEY (hierarchy_id, entity_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hes_hierarchy ON hierarchy_entity_set(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_hes_entity ON hierarchy_entity_set(entity_id);
-
--- Hierarchy Content: Entity Directory
-CREATE TABLE IF NOT EXISTS hierarchy_entity_directory (
-    hierarchy_id UUID NOT NULL,
-    key VARCHAR(255) NOT NULL,
-    entity_id UUID NOT NULL,
-    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
-    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
-    PRIMARY KEY (hierarchy_id, key)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hed_hierarchy ON hierarchy_entity_directory(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_hed_entity ON hierarchy_entity_directory(entity_id);
-CREATE INDEX IF NOT EXISTS idx_hed_key ON hierarchy_entity_directory(hierarchy_id, key);
-
--- Hierarchy Content: Entity Tree Node
-CREATE TABLE IF NOT EXISTS hierarchy_entity_tree_node (
-    hierarchy_id UUID NOT NULL,
-    node_id UUID NOT NULL,
-    entity_id UUID NOT NULL,
-    parent_node_id UUID,
-    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
-    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
-    PRIMARY KEY (hierarchy_id, node_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hetn_hierarchy ON hierarchy_entity_tree_node(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_hetn_entity ON hierarchy_entity_tree_node(entity_id);
-CREATE INDEX IF NOT EXISTS idx_hetn_parent ON hierarchy_entity_tree_node(parent_node_id);
-
--- Hierarchy Content: Aspect Map
-CREATE TABLE IF NOT EXISTS hierarchy_aspect_map (
-    hierarchy_id UUID NOT NULL,
-    entity_id UUID NOT NULL,
-    aspect_id BIGINT NOT NULL,
-    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
-    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
-    FOREIGN KEY (aspect_id) REFERENCES aspect(id) ON DELETE CASCADE,
-    PRIMARY KEY (hierarchy_id, entity_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_ham_hierarchy ON hierarchy_aspect_map(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_ham_entity ON hierarchy_aspect_map(entity_id);
-CREATE INDEX IF NOT EXISTS idx_ham_aspect ON hierarchy_aspect_map(aspect_id);
+# Every table created by the CHEAP schema DDL
+SCHEMA_TABLES: frozenset[str] = frozenset(
+    {
+        "aspect",
+        "aspect_def",
+        "catalog",
+        "catalog_aspect_def",
+        "entity",
+        "hierarchy",
+        "hierarchy_aspect_map",
+        "hierarchy_def",
+        "hierarchy_entity_directory",
+        "hierarchy_entity_list",
+        "hierarchy_entity_set",
+        "hierarchy_entity_tree_node",
+        "property_def",
+        "property_value",
+    }
+)
+
+# Looks the tables up in pg_class directly rather than through the
+# information_schema.tables view, which adds joins and privilege filtering
+SELECT_SCHEMA_TABLES_SQL = """
+SELECT c.relname
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relname = ANY (%s::text[])
+  AND c.relkind IN ('r', 'p')
+  AND n.nspname = ANY (current_schemas(false))
 """
 
-# Audit schema DDL - ported from postgres-cheap-audit.sql
-AUDIT_DDL = """
--- Add audit columns to definition tables
-ALTER TABLE aspect_def
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
-ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
-ALTER TABLE property_def
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
-ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
--- Add audit columns to catalog
-ALTER TABLE catalog
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
-ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
--- Add audit columns to hierarchy
-ALTER TABLE hierarchy
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
-ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
--- Add audit columns to aspect
-ALTER TABLE aspect
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
-ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
--- Add audit columns to property_value
-ALTER TABLE property_value
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
-ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
--- Add created_at to link tables
-ALTER TABLE catalog_aspect_def
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
--- Add created_at to hierarchy content tables
-ALTER TABLE hierarchy_entity_list
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
-ALTER TABLE hierarchy_entity_set
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
-ALTER TABLE hierarchy_entity_directory
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
-ALTER TABLE hierarchy_entity_tree_node
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
-ALTER TABLE hierarchy_aspect_map
-ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP;
-
--- Create trigger function for updated_at columns
-CREATE OR REPLACE FUNCTION update_updated_at_column()
-RETURNS TRIGGER AS $$
-BEGIN
-    NEW.updated_at = CURRENT_TIMESTAMP;
-    RETURN NEW;
-END;
-$$ language 'plpgsql';
-
--- Create triggers for updated_at columns
-DROP TRIGGER IF EXISTS update_aspect_def_updated_at ON aspect_def;
-CREATE TRIGGER update_aspect_def_updated_at BEFORE UPDATE ON aspect_def
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-
-DROP TRIGGER IF EXISTS update_property_def_updated_at ON property_def;
-CREATE TRIGGER update_property_def_updated_at BEFORE UPDATE ON property_def
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-
-DROP TRIGGER IF EXISTS update_catalog_updated_at ON catalog;
-CREATE TRIGGER update_catalog_updated_at BEFORE UPDATE ON catalog
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-
-DROP TRIGGER IF EXISTS update_hierarchy_updated_at ON hierarchy;
-CREATE TRIGGER update_hierarchy_updated_at BEFORE UPDATE ON hierarchy
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-
-DROP TRIGGER IF EXISTS update_aspect_updated_at ON aspect;
-CREATE TRIGGER update_aspect_updated_at BEFORE UPDATE ON aspect
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-
-DROP TRIGGER IF EXISTS update_property_value_updated_at ON property_value;
-CREATE TRIGGER update_property_value_updated_at BEFORE UPDATE ON property_value
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-"""
 
-# Drop schema DDL - ported from postgres-cheap-drop.sql
-DROP_DDL = """
--- Drop triggers
-DROP TRIGGER IF EXISTS update_aspect_def_updated_at ON aspect_def;
-DROP TRIGGER IF EXISTS update_property_def_updated_at ON property_def;
-DROP TRIGGER IF EXISTS update_catalog_updated_at ON catalog;
-DROP TRIGGER IF EXISTS update_hierarchy_updated_at ON hierarchy;
-DROP TRIGGER IF EXISTS update_aspect_updated_at ON aspect;
-DROP TRIGGER IF EXISTS update_property_value_updated_at ON property_value;
-
--- Drop functions
-DROP FUNCTION IF EXISTS update_updated_at_column();
-
--- Drop hierarchy content tables
-DROP TABLE IF EXISTS hierarchy_aspect_map CASCADE;
-DROP TABLE IF EXISTS hierarchy_entity_tree_node CASCADE;
-DROP TABLE IF EXISTS hierarchy_entity_directory CASCADE;
-DROP TABLE IF EXISTS hierarchy_entity_set CASCADE;
-DROP TABLE IF EXISTS hierarchy_entity_list CASCADE;
-
--- Drop property value storage
-DROP TABLE IF EXISTS property_value CASCADE;
-
--- Drop core entity tables
-DROP TABLE IF EXISTS aspect CASCADE;
-DROP TABLE IF EXISTS hierarchy CASCADE;
-DROP TABLE IF EXISTS catalog_aspect_def CASCADE;
-DROP TABLE IF EXISTS catalog CASCADE;
-
--- Drop definition tables
-DROP TABLE IF EXISTS hierarchy_def CASCADE;
-DROP TABLE IF EXISTS property_def CASCADE;
-DROP TABLE IF EXISTS aspect_def CASCADE;
-"""
+@functools.cache
+def _load(name: str) -> bytes:
+    """
+    Read a DDL script shipped in the package's ``sql`` directory.
 
-# Truncate schema DDL - ported from postgres-cheap-truncate.sql
-TRUNCATE_DDL = """
--- Disable triggers to avoid foreign key issues
-SET session_replication_role = replica;
-
--- Truncate all tables in reverse dependency order
-TRUNCATE TABLE hierarchy_aspect_map CASCADE;
-TRUNCATE TABLE hierarchy_entity_tree_node CASCADE;
-TRUNCATE TABLE hierarchy_entity_directory CASCADE;
-TRUNCATE TABLE hierarchy_entity_set CASCADE;
-TRUNCATE TABLE hierarchy_entity_list CASCADE;
-TRUNCATE TABLE property_value CASCADE;
-TRUNCATE TABLE aspect CASCADE;
-TRUNCATE TABLE hierarchy CASCADE;
-TRUNCATE TABLE catalog_aspect_def CASCADE;
-TRUNCATE TABLE catalog CASCADE;
-TRUNCATE TABLE hierarchy_def CASCADE;
-TRUNCATE TABLE property_def CASCADE;
-TRUNCATE TABLE aspect_def CASCADE;
-
--- Re-enable triggers
-SET session_replication_role = DEFAULT;
-"""
+    Scripts are only read on first use and cached afterwards, so importing this
+    module (e.g. just for schema_exists) does not pull the DDL text into memory.
+    They are kept as UTF-8 bytes, which psycopg sends without re-encoding.
+    """
+    return (importlib.resources.files("cheap.db.postgres") / "sql" / name).read_bytes()
 
 
-class PostgresSchema:
+@functools.cache
+def _concurrent_index_statements() -> tuple[bytes, ...]:
+    """Rewrite the index script as individual CREATE INDEX CONCURRENTLY statements."""
+    return tuple(
+        line.rstrip(b";").replace(b"CREATE INDEX", b"CREATE INDEX CONCURRENTLY", 1)
+        for line in _load("indexes.sql").splitlines()
+        if line.startswith(b"CREATE INDEX")
+    )
+
+
+@functools.cache
+def _tables_ddl(partitions: int, unlogged: bool) -> bytes:
     """
-    PostgreSQL schema management for the CHEAP data model.
+    Build the CREATE TABLE script.
 
-    Provides methods to create, drop, and truncate the database schema.
-    Supports optional audit tracking with timestamps and automatic triggers.
+    property_value is hash-partitioned when partitions > 0, and every table is
+    created UNLOGGED when unlogged is set.
+
+    Raises:
+        ValueError: If partitions is negative.
+    """
+    if partitions < 0:
+        raise ValueError(f"partitions must not be negative, got {partitions}")
+    ddl = _load("schema.sql")
+    if partitions:
+        ddl += (
+            _load("property_value_partitioned.sql")
+            + "".join(
+                f"CREATE TABLE IF NOT EXISTS property_value_p{remainder} PARTITION OF property_value "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder});\n"
+                for remainder in range(partitions)
+            ).encode()
+        )
+    else:
+        ddl += _load("property_value.sql")
+    if unlogged:
+        ddl = ddl.replace(b"CREATE TABLE IF NOT EXISTS", b"CREATE UNLOGGED TABLE IF NOT EXISTS")
+    return ddl
+
+
+@functools.cache
+def _create_script(partitions: int, unlogged: bool, indexes: bool, audit: bool) -> bytes:
     """
+    Assemble the complete create_schema script for one combination of options.
 
-    @staticmethod
-    async def create_schema(
-        conn: psycopg.AsyncConnection[tuple], *, include_audit: bool = False
-    ) -> None:
-        """
-        Create the CHEAP database schema.
+    Tables, then indexes, optionally followed by the audit functionality. The
+    result is cached, so repeated schema creation reuses the same bytes.
+    """
+    ddl = _tables_ddl(partitions, unlogged)
+    if indexes:
+        ddl += _load("indexes.sql")
+    if audit:
+        ddl += _load("audit.sql")
+    return ddl
 
-        Args:
-            conn: PostgreSQL database connection.
-            include_audit: If True, also create audit columns and triggers.
 
-        Raises:
-            psycopg.Error: If schema creation fails.
-        """
+async def _create_indexes_concurrently(conn: psycopg.AsyncConnection[tuple]) -> None:
+    """
+    Build the secondary indexes with CREATE INDEX CONCURRENTLY.
+
+    CONCURRENTLY cannot run inside a transaction block, so each statement is
+    sent on its own in autocommit mode. Writers to populated tables are not
+    blocked while the indexes build.
+    """
+    autocommit = conn.autocommit
+    await conn.set_autocommit(True)
+    try:
         async with conn.cursor() as cur:
-            # Execute main schema DDL
-            await cur.execute(SCHEMA_DDL)
+            for statement in _concurrent_index_statements():
+                await cur.execute(statement)
+    finally:
+        await conn.set_autocommit(autocommit)
 
-            # Optionally add audit functionality
-            if include_audit:
-                await cur.execute(AUDIT_DDL)
 
+async def _execute_ddl(conn: psycopg.AsyncConnection[tuple], ddl: bytes) -> None:
+    """
+    Execute a DDL script and commit it.
+
+    On an idle connection the script is wrapped in BEGIN/COMMIT and sent as one
+    simple query in autocommit mode, so the transaction is opened, run and
+    committed in a single round-trip rather than three. Inside a transaction
+    the caller already opened, the script joins it and is committed as before.
+    """
+    if conn.info.transaction_status != pq.TransactionStatus.IDLE:
+        async with conn.cursor() as cur:
+            await cur.execute(ddl)
         await conn.commit()
+        return
 
-    @staticmethod
-    async def drop_schema(conn: psycopg.AsyncConnection[tuple]) -> None:
-        """
-        Drop all CHEAP database tables, triggers, and functions.
+    autocommit = conn.autocommit
+    await conn.set_autocommit(True)
+    try:
+        async with conn.cursor() as cur:
+            await cur.execute(b"BEGIN;\n" + ddl + b"\nCOMMIT;")
+    except Exception:
+        # A failed statement leaves the explicit transaction aborted
+        await conn.rollback()
+        raise
+    finally:
+        await conn.set_autocommit(autocommit)
+
+
+async def create_schema(
+    conn: psycopg.AsyncConnection[tuple],
+    *,
+    include_audit: bool = False,
+    concurrent_indexes: bool = False,
+    property_value_partitions: int = 0,
+    unlogged: bool = False,
+) -> None:
+    """
+    Create the CHEAP database schema.
+
+    Args:
+        conn: PostgreSQL database connection.
+        include_audit: If True, also create audit columns and triggers.
+        concurrent_indexes: If True, build the secondary indexes after the
+            tables are committed, using CREATE INDEX CONCURRENTLY so that
+            existing tables stay writable while they build.
+        property_value_partitions: If greater than 0, create property_value
+            as a table hash-partitioned on aspect_id with this many partitions.
+            Has no effect on an already existing property_value table.
+        unlogged: If True, create the tables UNLOGGED. Writes skip the WAL,
+            which makes them much faster, but the tables are emptied after a
+            crash and are not replicated; meant for tests and caches.
+
+    Raises:
+        ValueError: If property_value_partitions is negative, or is combined
+            with concurrent_indexes (PostgreSQL cannot build indexes on a
+            partitioned table concurrently) or with unlogged (a partitioned
+            table cannot be unlogged, nor reference unlogged tables).
+        psycopg.Error: If schema creation fails.
+    """
+    if property_value_partitions and concurrent_indexes:
+        raise ValueError("concurrent_indexes cannot be used with property_value_partitions")
+    if property_value_partitions and unlogged:
+        raise ValueError("unlogged cannot be used with property_value_partitions")
 
-        Args:
-            conn: PostgreSQL database connection.
+    # The whole build is sent as one multi-statement query, a single round-trip
+    ddl = _create_script(property_value_partitions, unlogged, not concurrent_indexes, include_audit)
+    await _execute_ddl(conn, ddl)
 
-        Raises:
-            psycopg.Error: If schema drop fails.
-        """
-        async with conn.cursor() as cur:
-            await cur.execute(DROP_DDL)
+    if concurrent_indexes:
+        await _create_indexes_concurrently(conn)
 
-        await conn.commit()
 
-    @staticmethod
-    async def truncate_data(conn: psycopg.AsyncConnection[tuple]) -> None:
-        """
-        Truncate all data from CHEAP database tables.
+async def drop_schema(conn: psycopg.AsyncConnection[tuple]) -> None:
+    """
+    Drop all CHEAP database tables, triggers, and functions.
 
-        Preserves schema structure but removes all data.
+    Args:
+        conn: PostgreSQL database connection.
 
-        Args:
-            conn: PostgreSQL database connection.
+    Raises:
+        psycopg.Error: If schema drop fails.
+    """
+    await _execute_ddl(conn, _load("drop.sql"))
 
-        Raises:
-            psycopg.Error: If truncation fails.
-        """
-        async with conn.cursor() as cur:
-            await cur.execute(TRUNCATE_DDL)
 
-        await conn.commit()
+async def truncate_data(conn: psycopg.AsyncConnection[tuple]) -> None:
+    """
+    Truncate all data from CHEAP database tables.
 
-    @staticmethod
-    async def schema_exists(conn: psycopg.AsyncConnection[tuple]) -> bool:
-        """
-        Check if the CHEAP schema exists in the database.
+    Preserves schema structure but removes all data. The BIGSERIAL id
+    sequences are restarted as part of the same statement, so ids begin at
+    1 again afterwards.
 
-        Args:
-            conn: PostgreSQL database connection.
+    Args:
+        conn: PostgreSQL database connection.
 
-        Returns:
-            True if schema exists, False otherwise.
-        """
-        async with conn.cursor() as cur:
-            await cur.execute(
-                "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'catalog')"
-            )
-            result = await cur.fetchone()
-            return result[0] if result else False
+    Raises:
+        psycopg.Error: If truncation fails.
+    """
+    await _execute_ddl(conn, _load("truncate.sql"))
+
+
+async def missing_tables(conn: psycopg.AsyncConnection[tuple]) -> frozenset[str]:
+    """
+    Find which CHEAP tables are absent from the database.
+
+    All tables are checked with a single query. The query is prepared on the
+    connection the first time it runs, so repeated checks (readiness probes,
+    test setup) skip parsing and planning.
+
+    Args:
+        conn: PostgreSQL database connection.
+
+    Returns:
+        Names of the expected tables that do not exist; empty if the schema
+        is complete.
+    """
+    async with conn.cursor() as cur:
+        await cur.execute(SELECT_SCHEMA_TABLES_SQL, (list(SCHEMA_TABLES),), prepare=True)
+        rows = await cur.fetchall()
+    return SCHEMA_TABLES.difference(row[0] for row in rows)
+
+
+async def schema_exists(conn: psycopg.AsyncConnection[tuple]) -> bool:
+    """
+    Check if the CHEAP schema exists in the database.
+
+    Args:
+        conn: PostgreSQL database connection.
+
+    Returns:
+        True if every CHEAP table exists, False otherwise.
+    """
+    missing = await missing_tables(conn)
+    return not missing
+
+
+class PostgresSchema:
+    """
+    PostgreSQL schema management for the CHEAP data model.
+
+    Provides methods to create, drop, and truncate the database schema.
+    Supports optional audit tracking with timestamps and automatic triggers.
+    The methods are the module-level functions of the same name.
+    """
+
+    create_schema = staticmethod(create_schema)
+    drop_schema = staticmethod(drop_schema)
+    truncate_data = staticmethod(truncate_data)
+    missing_tables = staticmethod(missing_tables)
+    schema_exists = staticmethod(schema_exists)
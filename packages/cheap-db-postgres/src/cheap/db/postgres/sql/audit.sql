@@ -0,0 +1,69 @@
+-- CHEAP audit columns and triggers - ported from postgres-cheap-audit.sql
+
+-- Add audit columns: created_at everywhere, updated_at on the mutable tables.
+-- One DO block instead of a dozen ALTER TABLE statements.
+DO $$
+DECLARE
+    t text;
+    with_updated_at boolean;
+BEGIN
+    FOR t, with_updated_at IN VALUES
+        ('aspect_def', true),
+        ('property_def', true),
+        ('catalog', true),
+        ('hierarchy', true),
+        ('aspect', true),
+        ('property_value', true),
+        ('catalog_aspect_def', false),
+        ('hierarchy_entity_list', false),
+        ('hierarchy_entity_set', false),
+        ('hierarchy_entity_directory', false),
+        ('hierarchy_entity_tree_node', false),
+        ('hierarchy_aspect_map', false)
+    LOOP
+        EXECUTE format('ALTER TABLE %I ADD COLUMN IF NOT EXISTS created_at '
+                       'TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP', t);
+        IF with_updated_at THEN
+            EXECUTE format('ALTER TABLE %I ADD COLUMN IF NOT EXISTS updated_at '
+                           'TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP', t);
+        END IF;
+    END LOOP;
+END
+$$;
+
+-- Create trigger function for updated_at columns
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+-- Create triggers for updated_at columns. They only fire when the row actually
+-- changes, so no-op updates leave updated_at alone. PostgreSQL 14+ replaces an
+-- existing trigger in place; older servers fall back to dropping and
+-- recreating it.
+DO $$
+DECLARE
+    t text;
+    create_trigger text := CASE
+        WHEN current_setting('server_version_num')::int >= 140000
+        THEN 'CREATE OR REPLACE TRIGGER'
+        ELSE 'CREATE TRIGGER'
+    END;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'aspect_def', 'property_def', 'catalog', 'hierarchy', 'aspect', 'property_value'
+    ]
+    LOOP
+        IF create_trigger = 'CREATE TRIGGER' THEN
+            EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', 'update_' || t || '_updated_at', t);
+        END IF;
+        EXECUTE format('%s %I BEFORE UPDATE ON %I FOR EACH ROW '
+                       'WHEN (OLD.* IS DISTINCT FROM NEW.*) '
+                       'EXECUTE FUNCTION update_updated_at_column()',
+                       create_trigger, 'update_' || t || '_updated_at', t);
+    END LOOP;
+END
+$$;
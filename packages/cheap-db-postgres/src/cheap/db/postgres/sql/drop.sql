@@ -0,0 +1,25 @@
+-- Drop the CHEAP schema - ported from postgres-cheap-drop.sql
+
+-- Drop all tables in one statement; their triggers and indexes go with them
+DROP TABLE IF EXISTS
+    hierarchy_aspect_map,
+    hierarchy_entity_tree_node,
+    hierarchy_entity_directory,
+    hierarchy_entity_set,
+    hierarchy_entity_list,
+    property_value,
+    aspect,
+    entity,
+    hierarchy,
+    catalog_aspect_def,
+    catalog,
+    hierarchy_def,
+    property_def,
+    aspect_def
+CASCADE;
+
+-- Drop functions
+DROP FUNCTION IF EXISTS update_updated_at_column();
+
+-- Drop types
+DROP TYPE IF EXISTS property_type, catalog_species, hierarchy_type;
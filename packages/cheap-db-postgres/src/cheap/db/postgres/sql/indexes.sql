@@ -0,0 +1,34 @@
+-- CHEAP secondary indexes - ported from postgres-cheap.sql
+--
+-- Only indexes that are not already covered are created here. A lookup on a
+-- leading column set (aspect_def.name; property_def.aspect_def_id;
+-- hierarchy_def.catalog_id; catalog_aspect_def.catalog_id; aspect.entity_id;
+-- property_value.aspect_id; the hierarchy_id of the hierarchy content tables)
+-- is served by the table's primary key, UNIQUE constraint or a composite
+-- index below.
+
+CREATE INDEX IF NOT EXISTS idx_catalog_species ON catalog(species);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_aspect_def_aspect ON catalog_aspect_def(aspect_def_id);
+
+CREATE INDEX IF NOT EXISTS idx_entity_catalog ON entity(catalog_id);
+
+CREATE INDEX IF NOT EXISTS idx_hierarchy_catalog ON hierarchy(catalog_id);
+CREATE INDEX IF NOT EXISTS idx_hierarchy_def ON hierarchy(hierarchy_def_id);
+
+CREATE INDEX IF NOT EXISTS idx_aspect_def ON aspect(aspect_def_id);
+
+CREATE INDEX IF NOT EXISTS idx_property_value_property_def ON property_value(property_def_id);
+CREATE INDEX IF NOT EXISTS idx_property_value_aspect_property ON property_value(aspect_id, property_def_id);
+
+CREATE INDEX IF NOT EXISTS idx_hel_entity ON hierarchy_entity_list(entity_id);
+
+CREATE INDEX IF NOT EXISTS idx_hes_entity ON hierarchy_entity_set(entity_id);
+
+CREATE INDEX IF NOT EXISTS idx_hed_entity ON hierarchy_entity_directory(entity_id);
+
+CREATE INDEX IF NOT EXISTS idx_hetn_entity ON hierarchy_entity_tree_node(entity_id);
+CREATE INDEX IF NOT EXISTS idx_hetn_parent ON hierarchy_entity_tree_node(parent_node_id);
+
+CREATE INDEX IF NOT EXISTS idx_ham_entity ON hierarchy_aspect_map(entity_id);
+CREATE INDEX IF NOT EXISTS idx_ham_aspect ON hierarchy_aspect_map(aspect_id);
@@ -0,0 +1,17 @@
+-- CHEAP property value table - ported from postgres-cheap.sql
+
+-- Property Value Table
+CREATE TABLE IF NOT EXISTS property_value (
+    id BIGSERIAL PRIMARY KEY,
+    aspect_id BIGINT NOT NULL,
+    property_def_id BIGINT NOT NULL,
+    value_index INTEGER NOT NULL DEFAULT 0,
+    value_text TEXT,
+    value_binary BYTEA,
+    FOREIGN KEY (aspect_id) REFERENCES aspect(id) ON DELETE CASCADE,
+    FOREIGN KEY (property_def_id) REFERENCES property_def(id) ON DELETE CASCADE
+);
+
+-- Binary values are usually already compressed; store them out of line
+-- without attempting TOAST compression
+ALTER TABLE property_value ALTER COLUMN value_binary SET STORAGE EXTERNAL;
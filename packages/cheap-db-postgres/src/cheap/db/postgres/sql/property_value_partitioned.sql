@@ -0,0 +1,20 @@
+-- CHEAP property value table, hash-partitioned on aspect_id so that an
+-- aspect's values share a partition. The partitions themselves are created
+-- by create_schema.
+
+-- Property Value Table (the primary key must include the partition key)
+CREATE TABLE IF NOT EXISTS property_value (
+    id BIGSERIAL NOT NULL,
+    aspect_id BIGINT NOT NULL,
+    property_def_id BIGINT NOT NULL,
+    value_index INTEGER NOT NULL DEFAULT 0,
+    value_text TEXT,
+    value_binary BYTEA,
+    FOREIGN KEY (aspect_id) REFERENCES aspect(id) ON DELETE CASCADE,
+    FOREIGN KEY (property_def_id) REFERENCES property_def(id) ON DELETE CASCADE,
+    PRIMARY KEY (id, aspect_id)
+) PARTITION BY HASH (aspect_id);
+
+-- Binary values are usually already compressed; store them out of line
+-- without attempting TOAST compression
+ALTER TABLE property_value ALTER COLUMN value_binary SET STORAGE EXTERNAL;
@@ -0,0 +1,158 @@
+-- CHEAP main schema - ported from postgres-cheap.sql
+
+-- Enable UUID extension
+CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+
+-- Enumerated tag types (CREATE TYPE has no IF NOT EXISTS)
+DO $$
+BEGIN
+    CREATE TYPE property_type AS ENUM (
+        'INT', 'FLT', 'BLN', 'STR', 'TXT', 'BGI', 'BGF', 'DAT', 'URI', 'UID', 'CLB', 'BLB'
+    );
+EXCEPTION WHEN duplicate_object THEN NULL;
+END
+$$;
+
+DO $$
+BEGIN
+    CREATE TYPE catalog_species AS ENUM ('SOURCE', 'SINK', 'MIRROR', 'CACHE', 'CLONE', 'FORK');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END
+$$;
+
+DO $$
+BEGIN
+    CREATE TYPE hierarchy_type AS ENUM ('EL', 'ES', 'ED', 'ET', 'AM');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END
+$$;
+
+-- Aspect Definition Table
+CREATE TABLE IF NOT EXISTS aspect_def (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    name TEXT NOT NULL UNIQUE CHECK (length(name) <= 255),
+    is_readable BOOLEAN NOT NULL DEFAULT TRUE,
+    is_writable BOOLEAN NOT NULL DEFAULT TRUE,
+    can_add_properties BOOLEAN NOT NULL DEFAULT FALSE,
+    can_remove_properties BOOLEAN NOT NULL DEFAULT FALSE
+);
+
+-- Property Definition Table
+CREATE TABLE IF NOT EXISTS property_def (
+    id BIGSERIAL PRIMARY KEY,
+    aspect_def_id UUID NOT NULL,
+    name TEXT NOT NULL CHECK (length(name) <= 255),
+    type property_type NOT NULL,
+    is_writable BOOLEAN NOT NULL DEFAULT TRUE,
+    is_nullable BOOLEAN NOT NULL DEFAULT TRUE,
+    is_multivalued BOOLEAN NOT NULL DEFAULT FALSE,
+    default_value TEXT,
+    FOREIGN KEY (aspect_def_id) REFERENCES aspect_def(id) ON DELETE CASCADE,
+    UNIQUE (aspect_def_id, name)
+);
+
+-- Catalog Table
+CREATE TABLE IF NOT EXISTS catalog (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    species catalog_species NOT NULL,
+    version TEXT NOT NULL CHECK (length(version) <= 255)
+);
+
+-- Catalog-AspectDef Link Table
+CREATE TABLE IF NOT EXISTS catalog_aspect_def (
+    catalog_id UUID NOT NULL,
+    aspect_def_id UUID NOT NULL,
+    FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
+    FOREIGN KEY (aspect_def_id) REFERENCES aspect_def(id) ON DELETE CASCADE,
+    PRIMARY KEY (catalog_id, aspect_def_id)
+);
+
+-- Hierarchy Definition Table
+CREATE TABLE IF NOT EXISTS hierarchy_def (
+    id BIGSERIAL PRIMARY KEY,
+    catalog_id UUID NOT NULL,
+    name TEXT NOT NULL CHECK (length(name) <= 255),
+    type hierarchy_type NOT NULL,
+    FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
+    UNIQUE (catalog_id, name)
+);
+
+-- Entity Table
+CREATE TABLE IF NOT EXISTS entity (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    catalog_id UUID NOT NULL,
+    FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE
+);
+
+-- Hierarchy Table
+CREATE TABLE IF NOT EXISTS hierarchy (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    catalog_id UUID NOT NULL,
+    hierarchy_def_id BIGINT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
+    FOREIGN KEY (hierarchy_def_id) REFERENCES hierarchy_def(id) ON DELETE CASCADE
+);
+
+-- Aspect Table
+CREATE TABLE IF NOT EXISTS aspect (
+    id BIGSERIAL PRIMARY KEY,
+    entity_id UUID NOT NULL,
+    aspect_def_id UUID NOT NULL,
+    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
+    FOREIGN KEY (aspect_def_id) REFERENCES aspect_def(id) ON DELETE CASCADE,
+    UNIQUE (entity_id, aspect_def_id)
+);
+
+-- Hierarchy Content: Entity List
+CREATE TABLE IF NOT EXISTS hierarchy_entity_list (
+    hierarchy_id UUID NOT NULL,
+    entity_id UUID NOT NULL,
+    position INTEGER NOT NULL,
+    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
+    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
+    PRIMARY KEY (hierarchy_id, position)
+);
+
+-- Hierarchy Content: Entity Set
+CREATE TABLE IF NOT EXISTS hierarchy_entity_set (
+    hierarchy_id UUID NOT NULL,
+    entity_id UUID NOT NULL,
+    position INTEGER,
+    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
+    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
+    PRIMARY KEY (hierarchy_id, entity_id)
+);
+
+-- Hierarchy Content: Entity Directory
+CREATE TABLE IF NOT EXISTS hierarchy_entity_directory (
+    hierarchy_id UUID NOT NULL,
+    key TEXT NOT NULL CHECK (length(key) <= 255),
+    entity_id UUID NOT NULL,
+    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
+    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
+    PRIMARY KEY (hierarchy_id, key)
+);
+
+-- Hierarchy Content: Entity Tree Node
+CREATE TABLE IF NOT EXISTS hierarchy_entity_tree_node (
+    hierarchy_id UUID NOT NULL,
+    node_id UUID NOT NULL,
+    entity_id UUID NOT NULL,
+    parent_node_id UUID,
+    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
+    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
+    PRIMARY KEY (hierarchy_id, node_id)
+);
+
+-- Hierarchy Content: Aspect Map
+CREATE TABLE IF NOT EXISTS hierarchy_aspect_map (
+    hierarchy_id UUID NOT NULL,
+    entity_id UUID NOT NULL,
+    aspect_id BIGINT NOT NULL,
+    FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
+    FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
+    FOREIGN KEY (aspect_id) REFERENCES aspect(id) ON DELETE CASCADE,
+    PRIMARY KEY (hierarchy_id, entity_id)
+);
+
@@ -0,0 +1,20 @@
+-- Truncate CHEAP data - ported from postgres-cheap-truncate.sql
+
+-- Truncate all tables in one statement, resetting their id sequences;
+-- CASCADE takes care of foreign keys
+TRUNCATE TABLE
+    hierarchy_aspect_map,
+    hierarchy_entity_tree_node,
+    hierarchy_entity_directory,
+    hierarchy_entity_set,
+    hierarchy_entity_list,
+    property_value,
+    aspect,
+    entity,
+    hierarchy,
+    catalog_aspect_def,
+    catalog,
+    hierarchy_def,
+    property_def,
+    aspect_def
+RESTART IDENTITY CASCADE;
@@ -0,0 +1,25 @@
+"""Shared fixtures for PostgreSQL tests."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+from cheap.db.postgres.adapter import PostgresAdapter
+
+
+@pytest_asyncio.fixture(scope="session")
+async def adapter() -> AsyncGenerator[PostgresAdapter, None]:
+    """Create one pooled adapter shared by every test in the session."""
+    adapter = await PostgresAdapter.create(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        dbname=os.getenv("POSTGRES_DB", "cheap_test"),
+        user=os.getenv("POSTGRES_USER", "cheap_user"),
+        password=os.getenv("POSTGRES_PASSWORD", ""),
+        pool_size=5,
+        min_size=1,
+    )
+    yield adapter
+    await adapter.close()
@@ -103,25 +103,18 @@ class TestPostgresAdapter:
             await adapter.get_connection()
 
     @pytest.mark.asyncio
-    async def test_timezone_set_to_utc(self) -> None:
+    async def test_timezone_set_to_utc(self, adapter: PostgresAdapter) -> None:
         """Test that timezone is automatically set to UTC."""
-        async with await PostgresAdapter.create(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            dbname=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-        ) as adapter:
-            conn = await adapter.get_connection()
+        conn = await adapter.get_connection()
 
-            async with conn.cursor() as cur:
-                await cur.execute("SHOW TIME ZONE")
-                result = await cur.fetchone()
+        async with conn.cursor() as cur:
+            await cur.execute("SHOW TIME ZONE")
+            result = await cur.fetchone()
 
-            assert result is not None
-            assert result[0].upper() == "UTC"
+        assert result is not None
+        assert result[0].upper() == "UTC"
 
-            await adapter.return_connection(conn)
+        await adapter.return_connection(conn)
 
     @pytest.mark.asyncio
     async def test_init_schema_on_create(self) -> None:
@@ -135,6 +128,7 @@ class TestPostgresAdapter:
             user=POSTGRES_USER,
             password=POSTGRES_PASSWORD,
             init_schema=True,
+            unlogged=True,
         ) as adapter:
             conn = await adapter.get_connection()
 
@@ -147,29 +141,59 @@ class TestPostgresAdapter:
             await adapter.return_connection(conn)
 
     @pytest.mark.asyncio
-    async def test_multiple_connections_from_pool(self) -> None:
+    async def test_multiple_connections_from_pool(self, adapter: PostgresAdapter) -> None:
         """Test acquiring multiple connections from pool."""
+        # Acquire multiple connections
+        conn1 = await adapter.get_connection()
+        conn2 = await adapter.get_connection()
+        conn3 = await adapter.get_connection()
+
+        assert conn1 is not None
+        assert conn2 is not None
+        assert conn3 is not None
+
+        # Return connections to pool
+        await adapter.return_connection(conn1)
+        await adapter.return_connection(conn2)
+        await adapter.return_connection(conn3)
+
+    @pytest.mark.asyncio
+    async def test_acquire(self, adapter: PostgresAdapter) -> None:
+        """Test holding a connection for a block."""
+        async with adapter.acquire() as conn, conn.cursor() as cur:
+            await cur.execute("SELECT 1")
+            assert await cur.fetchone() == (1,)
+
+        # Errors in the block propagate after the connection is returned
+        with pytest.raises(RuntimeError, match="boom"):
+            async with adapter.acquire():
+                raise RuntimeError("boom")
+
+    @pytest.mark.asyncio
+    async def test_max_queries_replaces_connection(self) -> None:
+        """Test that a pooled connection is replaced after max_queries checkouts."""
         async with await PostgresAdapter.create(
             host=POSTGRES_HOST,
             port=POSTGRES_PORT,
             dbname=POSTGRES_DB,
             user=POSTGRES_USER,
             password=POSTGRES_PASSWORD,
-            pool_size=5,
+            pool_size=1,
+            min_size=1,
+            max_queries=2,
         ) as adapter:
-            # Acquire multiple connections
-            conn1 = await adapter.get_connection()
-            conn2 = await adapter.get_connection()
-            conn3 = await adapter.get_connection()
-
-            assert conn1 is not None
-            assert conn2 is not None
-            assert conn3 is not None
-
-            # Return connections to pool
-            await adapter.return_connection(conn1)
-            await adapter.return_connection(conn2)
-            await adapter.return_connection(conn3)
+            first = await adapter.get_connection()
+            await adapter.return_connection(first)
+
+            # connection() checkouts count as well
+            async with await adapter.connection() as conn:
+                assert conn is first
+
+            async with adapter.acquire() as conn, conn.cursor() as cur:
+                assert conn is not first
+                assert first.closed
+                await cur.execute("SELECT 1")
+                assert await cur.fetchone() == (1,)
 
     @pytest.mark.asyncio
     async def test_repr(self) -> None:
@@ -3,25 +3,20 @@
 from __future__ import annotations
 
 import os
-from collections.abc import AsyncGenerator
+from decimal import Decimal
 from uuid import uuid4
 
 import pytest
-from cheap.core.aspect_impl import AspectDefImpl
+from cheap.core.aspect_impl import AspectDefImpl, AspectImpl
 from cheap.core.catalog_impl import CatalogImpl
 from cheap.core.catalog_species import CatalogSpecies
+from cheap.core.entity_impl import EntityImpl
 from cheap.core.property_impl import PropertyDefImpl
 from cheap.core.property_type import PropertyType
 from cheap.db.postgres.adapter import PostgresAdapter
-from cheap.db.postgres.dao import PostgresDao
+from cheap.db.postgres.dao import ENTITY_FETCH_SIZE, PROPERTY_VALUE_BATCH_SIZE, PostgresDao
 from cheap.db.postgres.schema import PostgresSchema
-
-# PostgreSQL connection parameters from environment
-POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
-POSTGRES_PORT = int(os.getenv("POSTGRES_PORT", "5432"))
-POSTGRES_DB = os.getenv("POSTGRES_DB", "cheap_test")
-POSTGRES_USER = os.getenv("POSTGRES_USER", "cheap_user")
-POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "")
+from psycopg import pq
 
 # Skip all tests if PostgreSQL is not available
 pytestmark = pytest.mark.skipif(
@@ -34,28 +29,15 @@ class TestPostgresDao:
     """Test suite for PostgresDao catalog persistence."""
 
     @pytest.fixture
-    async def adapter(self) -> AsyncGenerator[PostgresAdapter, None]:
-        """Create an adapter with schema."""
-        adapter = await PostgresAdapter.create(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            dbname=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-            init_schema=True,
-        )
-
-        # Clean any existing data
-        conn = await adapter.get_connection()
-        await PostgresSchema.truncate_data(conn)
-        await adapter.return_connection(conn)
+    async def dao(self, adapter: PostgresAdapter) -> PostgresDao:
+        """Create a DAO instance over the shared adapter, with empty tables."""
+        async with adapter.acquire() as conn:
+            if not await PostgresSchema.schema_exists(conn):
+                await PostgresSchema.create_schema(conn)
 
-        yield adapter
-        await adapter.close()
+            # Clean any existing data
+            await PostgresSchema.truncate_data(conn)
 
-    @pytest.fixture
-    def dao(self, adapter: PostgresAdapter) -> PostgresDao:
-        """Create a DAO instance."""
         return PostgresDao(adapter)
 
     @pytest.mark.asyncio
@@ -139,6 +121,128 @@ class TestPostgresDao:
         assert loaded_age_prop.property_type == PropertyType.INTEGER
         assert not loaded_age_prop.is_nullable
 
+    @pytest.mark.asyncio
+    async def test_save_catalog_concurrent(
+        self, adapter: PostgresAdapter, dao: PostgresDao
+    ) -> None:
+        """Test saving aspect definitions concurrently over the pool."""
+        catalog_id = uuid4()
+        catalog = CatalogImpl(
+            global_id=catalog_id,
+            species=CatalogSpecies.SOURCE,
+            version="1.0.0",
+        )
+        for i in range(adapter.pool_size + 2):
+            catalog.add_aspect_def(
+                AspectDefImpl(
+                    name=f"aspect{i}",
+                    properties={
+                        "value": PropertyDefImpl(name="value", property_type=PropertyType.STRING)
+                    },
+                )
+            )
+
+        await dao.save_catalog(catalog, concurrent=True)
+
+        loaded = await dao.load_catalog(catalog_id)
+        assert set(loaded.aspect_defs) == set(catalog.aspect_defs)
+        assert all("value" in aspect.properties for aspect in loaded.aspect_defs.values())
+
+    @pytest.mark.asyncio
+    async def test_save_entities(self, adapter: PostgresAdapter, dao: PostgresDao) -> None:
+        """Test saving entities round-trips their property values."""
+        catalog_id = uuid4()
+        catalog = CatalogImpl(
+            global_id=catalog_id,
+            species=CatalogSpecies.SOURCE,
+            version="1.0.0",
+        )
+        aspect_def = AspectDefImpl(
+            name="item",
+            properties={
+                "count": PropertyDefImpl(name="count", property_type=PropertyType.INTEGER),
+                "big": PropertyDefImpl(name="big", property_type=PropertyType.BIG_INTEGER),
+                "price": PropertyDefImpl(name="price", property_type=PropertyType.BIG_DECIMAL),
+                "data": PropertyDefImpl(name="data", property_type=PropertyType.BLOB),
+            },
+        )
+        catalog.add_aspect_def(aspect_def)
+
+        entity = EntityImpl()
+        aspect = AspectImpl(definition=aspect_def, entity=entity)
+        aspect.set_property("count", 42)
+        aspect.set_property("big", 2**70)
+        aspect.set_property("price", Decimal("12345678901234567890.123456789"))
+        aspect.set_property("data", b"\x00\x01binary")
+        entity.add_aspect(aspect)
+
+        await dao.save_catalog(catalog, entities=[entity])
+        # Re-saving replaces the values instead of adding to them
+        aspect.set_property("count", 43)
+        await dao.save_catalog(catalog, entities=[entity])
+
+        async with adapter.acquire() as conn, conn.cursor() as cur:
+            await cur.execute(
+                """
+                    SELECT pd.name, pv.value_text, pv.value_binary
+                    FROM property_value pv
+                    JOIN property_def pd ON pd.id = pv.property_def_id
+                    JOIN aspect a ON a.id = pv.aspect_id
+                    WHERE a.entity_id = %s
+                    """,
+                (entity.id,),
+            )
+            rows = {row[0]: row[1:] for row in await cur.fetchall()}
+
+        assert len(rows) == 4
+        assert int(rows["count"][0]) == 43
+        assert int(rows["big"][0]) == 2**70
+        assert Decimal(rows["price"][0]) == Decimal("12345678901234567890.123456789")
+        assert bytes(rows["data"][1]) == b"\x00\x01binary"
+
+    @pytest.mark.asyncio
+    async def test_save_entities_in_batches(
+        self, adapter: PostgresAdapter, dao: PostgresDao
+    ) -> None:
+        """Test saving more property values than one COPY batch holds."""
+        catalog_id = uuid4()
+        catalog = CatalogImpl(
+            global_id=catalog_id,
+            species=CatalogSpecies.SOURCE,
+            version="1.0.0",
+        )
+        aspect_def = AspectDefImpl(
+            name="counter",
+            properties={"n": PropertyDefImpl(name="n", property_type=PropertyType.INTEGER)},
+        )
+        catalog.add_aspect_def(aspect_def)
+
+        entities = []
+        for i in range(PROPERTY_VALUE_BATCH_SIZE + 10):
+            entity = EntityImpl()
+            aspect = AspectImpl(definition=aspect_def, entity=entity)
+            aspect.set_property("n", i)
+            entity.add_aspect(aspect)
+            entities.append(entity)
+
+        await dao.save_catalog(catalog, entities=entities)
+
+        async with adapter.acquire() as conn, conn.cursor() as cur:
+            await cur.execute(
+                """
+                    SELECT e.id, pv.value_text
+                    FROM property_value pv
+                    JOIN aspect a ON a.id = pv.aspect_id
+                    JOIN entity e ON e.id = a.entity_id
+                    WHERE e.catalog_id = %s
+                    """,
+                (catalog_id,),
+            )
+            values = dict(await cur.fetchall())
+
+        assert values == {entity.id: str(i) for i, entity in enumerate(entities)}
+        assert {entity.id async for entity in dao.iter_entities(catalog_id)} == set(values)
+
     @pytest.mark.asyncio
     async def test_delete_catalog(self, adapter: PostgresAdapter, dao: PostgresDao) -> None:
         """Test deleting a catalog."""
@@ -201,6 +305,12 @@ class TestPostgresDao:
         for prop_type in all_types:
             assert prop_type in PROPERTY_TYPE_TO_DB
 
+        # Both mappings are read-only
+        with pytest.raises(TypeError):
+            PROPERTY_TYPE_TO_DB[PropertyType.INTEGER] = "XXX"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            DB_TO_PROPERTY_TYPE["XXX"] = PropertyType.INTEGER  # type: ignore[index]
+
     @pytest.mark.asyncio
     async def test_upsert_catalog(self, adapter: PostgresAdapter, dao: PostgresDao) -> None:
         """Test that saving the same catalog twice uses upsert."""
@@ -226,6 +336,41 @@ class TestPostgresDao:
         loaded = await dao.load_catalog(catalog_id)
         assert loaded.version == "2.0.0"
 
+    @pytest.mark.asyncio
+    async def test_catalog_cache(self, adapter: PostgresAdapter, dao: PostgresDao) -> None:
+        """Test that cached catalogs are reused until saved again."""
+        catalog_id = uuid4()
+        catalog = CatalogImpl(
+            global_id=catalog_id,
+            species=CatalogSpecies.SOURCE,
+            version="1.0.0",
+        )
+        cached_dao = PostgresDao(adapter, catalog_cache_ttl=60.0)
+        await cached_dao.save_catalog(catalog)
+
+        loaded = await cached_dao.load_catalog(catalog_id)
+        cached = await cached_dao.load_catalog(catalog_id)
+        assert cached == loaded
+
+        # Each load returns its own copy
+        assert cached is not loaded
+        cached.add_aspect_def(AspectDefImpl(name="local", properties={}))
+        assert "local" not in (await cached_dao.load_catalog(catalog_id)).aspect_defs
+
+        # Saving evicts the cached catalog
+        catalog_v2 = CatalogImpl(
+            global_id=catalog_id,
+            species=CatalogSpecies.SOURCE,
+            version="2.0.0",
+        )
+        await cached_dao.save_catalog(catalog_v2)
+        assert (await cached_dao.load_catalog(catalog_id)).version == "2.0.0"
+
+        # So does deleting it
+        await cached_dao.delete_catalog(catalog_id)
+        with pytest.raises(ValueError, match="Catalog not found"):
+            await cached_dao.load_catalog(catalog_id)
+
     @pytest.mark.asyncio
     async def test_native_uuid_type(self, adapter: PostgresAdapter, dao: PostgresDao) -> None:
         """Test that PostgreSQL native UUID type is used."""
@@ -239,8 +384,7 @@ class TestPostgresDao:
         await dao.save_catalog(catalog)
 
         # Verify UUID is stored as native PostgreSQL UUID type
-        conn = await adapter.get_connection()
-        try:
+        async with adapter.acquire() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
                     """
@@ -253,5 +397,51 @@ class TestPostgresDao:
             assert result is not None
             # PostgreSQL returns 'uuid' as the type name
             assert result[0] == "uuid"
+
+    @pytest.mark.asyncio
+    async def test_iter_entities(self, adapter: PostgresAdapter, dao: PostgresDao) -> None:
+        """Test streaming a catalog's entities through a server-side cursor."""
+        catalog_id = uuid4()
+        catalog = CatalogImpl(
+            global_id=catalog_id,
+            species=CatalogSpecies.SOURCE,
+            version="1.0.0",
+        )
+        await dao.save_catalog(catalog)
+
+        # More entities than one fetch batch
+        entity_ids = {uuid4() for _ in range(ENTITY_FETCH_SIZE + 5)}
+        async with adapter.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.executemany(
+                    "INSERT INTO entity (id, catalog_id) VALUES (%s, %s)",
+                    [(entity_id, catalog_id) for entity_id in entity_ids],
+                )
+            await conn.commit()
+
+        loaded_ids = {entity.id async for entity in dao.iter_entities(catalog_id)}
+        assert loaded_ids == entity_ids
+
+    @pytest.mark.asyncio
+    async def test_iter_entities_leaves_connection_idle(self, dao: PostgresDao) -> None:
+        """Test that streaming entities ends the cursor's transaction."""
+        standalone = await PostgresAdapter.create(
+            host=os.getenv("POSTGRES_HOST", "localhost"),
+            port=int(os.getenv("POSTGRES_PORT", "5432")),
+            dbname=os.getenv("POSTGRES_DB", "cheap_test"),
+            user=os.getenv("POSTGRES_USER", "cheap_user"),
+            password=os.getenv("POSTGRES_PASSWORD", ""),
+        )
+        try:
+            standalone_dao = PostgresDao(standalone)
+            catalog_id = uuid4()
+            await standalone_dao.save_catalog(
+                CatalogImpl(global_id=catalog_id, species=CatalogSpecies.SOURCE, version="1.0.0")
+            )
+
+            assert [entity async for entity in standalone_dao.iter_entities(catalog_id)] == []
+
+            conn = await standalone.get_connection()
+            assert conn.info.transaction_status == pq.TransactionStatus.IDLE
         finally:
-            await adapter.return_connection(conn)
+            await standalone.close()
@@ -3,18 +3,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncGenerator
 
 import psycopg
 import pytest
 from cheap.db.postgres.adapter import PostgresAdapter
-from cheap.db.postgres.schema import PostgresSchema
-
-# PostgreSQL connection parameters from environment
-POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
-POSTGRES_PORT = int(os.getenv("POSTGRES_PORT", "5432"))
-POSTGRES_DB = os.getenv("POSTGRES_DB", "cheap_test")
-POSTGRES_USER = os.getenv("POSTGRES_USER", "cheap_user")
-POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "")
+from cheap.db.postgres.schema import SCHEMA_TABLES, PostgresSchema
 
 # Skip all tests if PostgreSQL is not available
 pytestmark = pytest.mark.skipif(
@@ -26,18 +20,30 @@ pytestmark = pytest.mark.skipif(
 class TestPostgresSchema:
     """Test suite for PostgreSQL schema operations."""
 
+    @pytest.fixture
+    async def schema_conn(
+        self, adapter: PostgresAdapter
+    ) -> AsyncGenerator[psycopg.AsyncConnection[tuple], None]:
+        """
+        Provide a connection to an existing schema.
+
+        The schema is only created when missing, so tests that just need the
+        tables in place avoid re-running the DDL. Whatever a test leaves
+        uncommitted (e.g. after an expected error) is rolled back afterwards;
+        what it commits stays, so tests clean up committed data themselves.
+        """
+        async with adapter.acquire() as conn:
+            if not await PostgresSchema.schema_exists(conn):
+                await PostgresSchema.create_schema(conn)
+
+            yield conn
+
+            await conn.rollback()
+
     @pytest.mark.asyncio
-    async def test_create_schema(self) -> None:
+    async def test_create_schema(self, adapter: PostgresAdapter) -> None:
         """Test creating the CHEAP schema."""
-        async with await PostgresAdapter.create(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            dbname=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-        ) as adapter:
-            conn = await adapter.get_connection()
-
+        async with adapter.acquire() as conn:
             # Clean up any existing schema
             await PostgresSchema.drop_schema(conn)
 
@@ -60,89 +66,173 @@ class TestPostgresSchema:
                     """
                 )
                 rows = await cur.fetchall()
-                tables = [row[0] for row in rows]
-
-            expected_tables = [
-                "aspect",
-                "aspect_def",
-                "catalog",
-                "catalog_aspect_def",
-                "entity",
-                "hierarchy",
-                "hierarchy_aspect_map",
-                "hierarchy_def",
-                "hierarchy_entity_directory",
-                "hierarchy_entity_list",
-                "hierarchy_entity_set",
-                "hierarchy_entity_tree_node",
-                "property_def",
-                "property_value",
-            ]
-
-            for table in expected_tables:
-                assert table in tables, f"Table {table} not found"
-
-            await adapter.return_connection(conn)
+                tables = {row[0] for row in rows}
+
+            expected_tables = frozenset(
+                {
+                    "aspect",
+                    "aspect_def",
+                    "catalog",
+                    "catalog_aspect_def",
+                    "entity",
+                    "hierarchy",
+                    "hierarchy_aspect_map",
+                    "hierarchy_def",
+                    "hierarchy_entity_directory",
+                    "hierarchy_entity_list",
+                    "hierarchy_entity_set",
+                    "hierarchy_entity_tree_node",
+                    "property_def",
+                    "property_value",
+                }
+            )
+
+            assert expected_tables <= tables, (
+                f"Tables not found: {sorted(expected_tables - tables)}"
+            )
 
     @pytest.mark.asyncio
-    async def test_create_schema_with_audit(self) -> None:
+    async def test_create_schema_with_audit(self, adapter: PostgresAdapter) -> None:
         """Test creating schema with audit functionality."""
-        async with await PostgresAdapter.create(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            dbname=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-        ) as adapter:
-            conn = await adapter.get_connection()
-
+        async with adapter.acquire() as conn:
             # Clean up and create schema with audit
             await PostgresSchema.drop_schema(conn)
             await PostgresSchema.create_schema(conn, include_audit=True)
 
-            # Check that audit columns exist in aspect_def
-            async with conn.cursor() as cur:
-                await cur.execute(
+            # Query the audit columns and the triggers in one pipelined round-trip;
+            # the first fetch syncs the pipeline and collects both results
+            async with (
+                conn.cursor() as column_cur,
+                conn.cursor() as trigger_cur,
+                conn.pipeline(),
+            ):
+                await column_cur.execute(
                     """
                     SELECT column_name FROM information_schema.columns
                     WHERE table_schema = 'public' AND table_name = 'aspect_def'
                     ORDER BY column_name
                     """
                 )
-                rows = await cur.fetchall()
-                columns = [row[0] for row in rows]
+                await trigger_cur.execute(
+                    """
+                    SELECT trigger_name FROM information_schema.triggers
+                    WHERE trigger_schema = 'public'
+                    """
+                )
+                columns = {row[0] for row in await column_cur.fetchall()}
+                triggers = {row[0] for row in await trigger_cur.fetchall()}
 
-            assert "created_at" in columns
-            assert "updated_at" in columns
+            # Check that audit columns exist in aspect_def
+            assert {"created_at", "updated_at"} <= columns
 
             # Check that triggers exist
+            assert {"update_aspect_def_updated_at", "update_catalog_updated_at"} <= triggers
+
+    @pytest.mark.asyncio
+    async def test_audit_trigger_skips_noop_update(self, adapter: PostgresAdapter) -> None:
+        """Test that updated_at only changes when the row actually changes."""
+        async with adapter.acquire() as conn:
+            await PostgresSchema.drop_schema(conn)
+            await PostgresSchema.create_schema(conn, include_audit=True)
+
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    "INSERT INTO aspect_def (name) VALUES ('audited') RETURNING updated_at"
+                )
+                created = await cur.fetchone()
+            await conn.commit()
+
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    "UPDATE aspect_def SET name = name WHERE name = 'audited' RETURNING updated_at"
+                )
+                unchanged = await cur.fetchone()
+                await cur.execute(
+                    "UPDATE aspect_def SET is_writable = FALSE WHERE name = 'audited' "
+                    "RETURNING updated_at"
+                )
+                changed = await cur.fetchone()
+            await conn.commit()
+
+            assert created is not None and unchanged is not None and changed is not None
+            assert unchanged[0] == created[0]
+            assert changed[0] > created[0]
+
+            await PostgresSchema.drop_schema(conn)
+
+    @pytest.mark.asyncio
+    async def test_create_schema_concurrent_indexes(self, adapter: PostgresAdapter) -> None:
+        """Test creating schema with indexes built concurrently."""
+        async with adapter.acquire() as conn:
+            await PostgresSchema.drop_schema(conn)
+            await PostgresSchema.create_schema(conn, concurrent_indexes=True)
+
+            # Check that the secondary indexes were built and are valid
             async with conn.cursor() as cur:
                 await cur.execute(
                     """
-                    SELECT trigger_name FROM information_schema.triggers
-                    WHERE trigger_schema = 'public'
+                    SELECT c.relname, i.indisvalid FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE c.relname LIKE 'idx_%'
+                    """
+                )
+                rows = await cur.fetchall()
+                indexes = dict(rows)
+
+            assert indexes["idx_entity_catalog"]
+            assert indexes["idx_property_value_aspect_property"]
+            assert all(indexes.values())
+
+    @pytest.mark.asyncio
+    async def test_create_schema_partitioned_property_value(self, adapter: PostgresAdapter) -> None:
+        """Test creating schema with a hash-partitioned property_value table."""
+        async with adapter.acquire() as conn:
+            await PostgresSchema.drop_schema(conn)
+            await PostgresSchema.create_schema(conn, property_value_partitions=4)
+            assert await PostgresSchema.schema_exists(conn)
+
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    "SELECT count(*) FROM pg_inherits WHERE inhparent = 'property_value'::regclass"
+                )
+                row = await cur.fetchone()
+
+            assert row == (4,)
+
+            with pytest.raises(ValueError):
+                await PostgresSchema.create_schema(
+                    conn, concurrent_indexes=True, property_value_partitions=4
+                )
+
+            await PostgresSchema.drop_schema(conn)
+
+    @pytest.mark.asyncio
+    async def test_create_schema_unlogged(self, adapter: PostgresAdapter) -> None:
+        """Test creating schema with unlogged tables."""
+        async with adapter.acquire() as conn:
+            await PostgresSchema.drop_schema(conn)
+            await PostgresSchema.create_schema(conn, include_audit=True, unlogged=True)
+
+            async with conn.cursor() as cur:
+                await cur.execute(
                     """
+                    SELECT relname, relpersistence FROM pg_class
+                    WHERE relname = ANY (%s) AND relkind = 'r'
+                    """,
+                    (list(SCHEMA_TABLES),),
                 )
                 rows = await cur.fetchall()
-                triggers = [row[0] for row in rows]
+                persistence = dict(rows)
 
-            assert "update_aspect_def_updated_at" in triggers
-            assert "update_catalog_updated_at" in triggers
+            assert persistence.keys() == SCHEMA_TABLES
+            assert set(persistence.values()) == {"u"}
 
-            await adapter.return_connection(conn)
+            await PostgresSchema.drop_schema(conn)
 
     @pytest.mark.asyncio
-    async def test_drop_schema(self) -> None:
+    async def test_drop_schema(self, adapter: PostgresAdapter) -> None:
         """Test dropping the schema."""
-        async with await PostgresAdapter.create(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            dbname=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-        ) as adapter:
-            conn = await adapter.get_connection()
-
+        async with adapter.acquire() as conn:
             # Create then drop schema
             await PostgresSchema.drop_schema(conn)
             await PostgresSchema.create_schema(conn)
@@ -151,81 +241,75 @@ class TestPostgresSchema:
             await PostgresSchema.drop_schema(conn)
             assert not await PostgresSchema.schema_exists(conn)
 
-            await adapter.return_connection(conn)
-
     @pytest.mark.asyncio
-    async def test_truncate_data(self) -> None:
-        """Test truncating data while preserving schema."""
-        async with await PostgresAdapter.create(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            dbname=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-        ) as adapter:
-            conn = await adapter.get_connection()
-
-            # Create schema
+    async def test_missing_tables(self, adapter: PostgresAdapter) -> None:
+        """Test reporting which schema tables are absent."""
+        async with adapter.acquire() as conn:
             await PostgresSchema.drop_schema(conn)
+            assert await PostgresSchema.missing_tables(conn) == SCHEMA_TABLES
+
             await PostgresSchema.create_schema(conn)
+            assert await PostgresSchema.missing_tables(conn) == frozenset()
 
-            # Insert test data
+            # A partially-migrated schema is reported table by table
             async with conn.cursor() as cur:
-                await cur.execute(
-                    """
-                    INSERT INTO aspect_def (id, name)
-                    VALUES ('550e8400-e29b-41d4-a716-446655440000'::uuid, 'test_aspect')
-                    """
-                )
+                await cur.execute("DROP TABLE hierarchy_aspect_map")
             await conn.commit()
+            assert await PostgresSchema.missing_tables(conn) == {"hierarchy_aspect_map"}
+            assert not await PostgresSchema.schema_exists(conn)
 
-            # Verify data exists
-            async with conn.cursor() as cur:
-                await cur.execute("SELECT COUNT(*) FROM aspect_def")
-                row = await cur.fetchone()
-                count = row[0] if row else 0
+            # Leave no partial schema behind for later tests
+            await PostgresSchema.drop_schema(conn)
 
-            assert count == 1
+    @pytest.mark.asyncio
+    async def test_truncate_data(self, schema_conn: psycopg.AsyncConnection[tuple]) -> None:
+        """Test truncating data while preserving schema."""
+        conn = schema_conn
 
-            # Truncate data
-            await PostgresSchema.truncate_data(conn)
+        # Insert test data
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                INSERT INTO aspect_def (id, name)
+                VALUES ('550e8400-e29b-41d4-a716-446655440000'::uuid, 'test_aspect')
+                """
+            )
+        await conn.commit()
 
-            # Verify data is gone but schema remains
-            assert await PostgresSchema.schema_exists(conn)
+        # Verify data exists
+        async with conn.cursor() as cur:
+            await cur.execute("SELECT COUNT(*) FROM aspect_def WHERE name = 'test_aspect'")
+            row = await cur.fetchone()
+            count = row[0] if row else 0
 
-            async with conn.cursor() as cur:
-                await cur.execute("SELECT COUNT(*) FROM aspect_def")
-                row = await cur.fetchone()
-                count = row[0] if row else 0
+        assert count == 1
+
+        # Truncate data
+        await PostgresSchema.truncate_data(conn)
 
-            assert count == 0
+        # Verify data is gone but schema remains
+        assert await PostgresSchema.schema_exists(conn)
 
-            await adapter.return_connection(conn)
+        async with conn.cursor() as cur:
+            await cur.execute("SELECT COUNT(*) FROM aspect_def")
+            row = await cur.fetchone()
+            count = row[0] if row else 0
+
+        assert count == 0
 
     @pytest.mark.asyncio
-    async def test_foreign_key_constraints(self) -> None:
+    async def test_foreign_key_constraints(
+        self, schema_conn: psycopg.AsyncConnection[tuple]
+    ) -> None:
         """Test that foreign key constraints are enforced."""
-        async with await PostgresAdapter.create(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            dbname=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-        ) as adapter:
-            conn = await adapter.get_connection()
-
-            await PostgresSchema.drop_schema(conn)
-            await PostgresSchema.create_schema(conn)
+        conn = schema_conn
 
-            # Attempt to insert property_def with non-existent aspect_def
-            with pytest.raises(psycopg.errors.ForeignKeyViolation):
-                async with conn.cursor() as cur:
-                    await cur.execute(
-                        """
-                        INSERT INTO property_def (aspect_def_id, name, type)
-                        VALUES ('550e8400-e29b-41d4-a716-446655440000'::uuid, 'test_prop', 'STR')
-                        """
-                    )
-                await conn.commit()
-
-            await adapter.return_connection(conn)
+        # Attempt to insert property_def with non-existent aspect_def
+        with pytest.raises(psycopg.errors.ForeignKeyViolation):
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    INSERT INTO property_def (aspect_def_id, name, type)
+                    VALUES ('550e8400-e29b-41d4-a716-446655440000'::uuid, 'test_prop', 'STR')
+                    """
+                )
@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
-from cheap.db.sqlite.adapter import SqliteAdapter
-from cheap.db.sqlite.dao import SqliteDao
-from cheap.db.sqlite.schema import SqliteSchema
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cheap.db.sqlite.adapter import SqliteAdapter
+    from cheap.db.sqlite.dao import SqliteDao
+    from cheap.db.sqlite.schema import SqliteSchema
 
 __all__ = [
     "SqliteAdapter",
     "SqliteDao",
     "SqliteSchema",
 ]
+
+# Module defining each public name; imported on first access (PEP 562), so
+# adapter-only users do not pay for loading the DAO and schema modules
+_EXPORTS = {
+    "SqliteAdapter": "cheap.db.sqlite.adapter",
+    "SqliteDao": "cheap.db.sqlite.dao",
+    "SqliteSchema": "cheap.db.sqlite.schema",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public class the first time it is accessed."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the not yet imported classes."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import Self
+from typing import Any, Self
 
 import aiosqlite
 
+# Prepared statements sqlite3 keeps per connection, keyed by SQL text
+CACHED_STATEMENTS = 256
+
 
 class SqliteAdapter:
     """
     SQLite database connection adapter.
 
     Manages async SQLite database connections with proper lifecycle management.
-    Supports both file-based and in-memory databases.
+    Supports both file-based and in-memory databases. Connections are in
+    autocommit mode; group writes into a transaction with an explicit BEGIN.
 
     Example:
         ```python
@@ -29,6 +36,8 @@ class SqliteAdapter:
         ```
     """
 
+    __slots__ = ("_db_path", "_is_memory", "_conn", "_sync_conn")
+
     def __init__(self, db_path: str | Path) -> None:
         """
         Initialize adapter (use create() instead).
@@ -36,8 +45,10 @@ class SqliteAdapter:
         Args:
             db_path: Path to database file or ":memory:" for in-memory database.
         """
-        self._db_path = str(db_path)
+        self._db_path = db_path if isinstance(db_path, str) else str(db_path)
+        self._is_memory = self._db_path == ":memory:"
         self._conn: aiosqlite.Connection | None = None
+        self._sync_conn: sqlite3.Connection | None = None
 
     @classmethod
     async def create(
@@ -89,22 +100,35 @@ class SqliteAdapter:
         if self._conn is not None:
             return
 
-        self._conn = await aiosqlite.connect(self._db_path)
-
-        # Enable foreign key support
-        await self._conn.execute("PRAGMA foreign_keys = ON")
-
-        # Enable WAL mode for better concurrency (not for in-memory)
-        if self._db_path != ":memory:":
-            await self._conn.execute("PRAGMA journal_mode = WAL")
-
-        await self._conn.commit()
+        # The sqlite3 connection is opened here and handed to aiosqlite, so
+        # execute_batch can drive the very same connection (and transaction,
+        # and in-memory database) without a per-statement queue round-trip.
+        # It runs in autocommit mode: sqlite3 never opens transactions
+        # implicitly, writers BEGIN and COMMIT their own. The statement cache
+        # is sized above the DAO's statement count, so they all stay prepared.
+        sync_conn = await asyncio.to_thread(
+            sqlite3.connect,
+            self._db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        self._conn = await aiosqlite.Connection(lambda: sync_conn, iter_chunk_size=64)
+        self._sync_conn = sync_conn
+
+        # Enable foreign key support, then WAL mode for better concurrency and
+        # the other per-connection performance settings, in a single script.
+        # Imported here so that importing the adapter does not load the schema
+        from cheap.db.sqlite.schema import SqliteSchema
+
+        await SqliteSchema.init_connection(self._conn)
 
     async def close(self) -> None:
         """Close database connection."""
         if self._conn is not None:
             await self._conn.close()
             self._conn = None
+            self._sync_conn = None
 
     async def get_connection(self) -> aiosqlite.Connection:
         """
@@ -120,6 +144,35 @@ class SqliteAdapter:
             raise RuntimeError("Not connected to database. Call connect() first.")
         return self._conn
 
+    async def execute_batch(self, statements: Iterable[tuple[str, Sequence[Any]]]) -> None:
+        """
+        Execute a batch of parameterized statements in one worker-thread hop.
+
+        Every aiosqlite call is queued to the connection's thread and awaited
+        separately; for many short writes that hand-off dominates. The batch is
+        instead queued as a single call, which runs the statements one after
+        the other on that same thread, so it never overlaps other calls on the
+        connection. Statements join the transaction the caller began, if any,
+        and are not committed; outside a transaction each one commits on its own.
+
+        Args:
+            statements: (sql, parameters) pairs, executed in order.
+
+        Raises:
+            RuntimeError: If not connected.
+            sqlite3.Error: If a statement fails; later statements are not run.
+        """
+        if self._conn is None or self._sync_conn is None:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        conn = self._sync_conn
+
+        def run() -> None:
+            for sql, parameters in statements:
+                conn.execute(sql, parameters)
+
+        # aiosqlite has no public hook for running a function on its thread
+        await self._conn._execute(run)  # pyright: ignore[reportPrivateUsage]
+
     @property
     def db_path(self) -> str:
         """Get the database path."""
@@ -128,7 +181,7 @@ class SqliteAdapter:
     @property
     def is_memory(self) -> bool:
         """Check if this is an in-memory database."""
-        return self._db_path == ":memory:"
+        return self._is_memory
 
     @property
     def is_connected(self) -> bool:
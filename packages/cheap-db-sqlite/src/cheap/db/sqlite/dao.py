@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import chain
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 from uuid import UUID
 
-from cheap.core.property_type import PropertyType
+from cheap.core.aspect_impl import AspectDefImpl
+from cheap.core.catalog_impl import CatalogImpl
+from cheap.core.catalog_species import CatalogSpecies
+from cheap.core.hierarchy_type import HierarchyType
+from cheap.core.property_impl import PropertyDefImpl
+from cheap.core.property_type import PropertyType, key_by_value
+
+from cheap.db.sqlite.schema import DROP_SECONDARY_INDEXES, SECONDARY_INDEXES
 
 if TYPE_CHECKING:
     import aiosqlite
@@ -18,24 +28,193 @@ if TYPE_CHECKING:
     from cheap.db.sqlite.adapter import SqliteAdapter
 
 
-# Property type mapping: PropertyType -> SQLite type abbreviation
-PROPERTY_TYPE_TO_DB = {
-    PropertyType.INTEGER: "INT",
-    PropertyType.FLOAT: "FLT",
-    PropertyType.BOOLEAN: "BLN",
-    PropertyType.STRING: "STR",
-    PropertyType.TEXT: "TXT",
-    PropertyType.BIG_INTEGER: "BGI",
-    PropertyType.BIG_DECIMAL: "BGF",
-    PropertyType.DATE_TIME: "DAT",
-    PropertyType.URI: "URI",
-    PropertyType.UUID: "UID",
-    PropertyType.CLOB: "CLB",
-    PropertyType.BLOB: "BLB",
+# Property type mapping: PropertyType -> SQLite type abbreviation (read-only)
+PROPERTY_TYPE_TO_DB: Final[Mapping[PropertyType, str]] = MappingProxyType(
+    {
+        PropertyType.INTEGER: "INT",
+        PropertyType.FLOAT: "FLT",
+        PropertyType.BOOLEAN: "BLN",
+        PropertyType.STRING: "STR",
+        PropertyType.TEXT: "TXT",
+        PropertyType.BIG_INTEGER: "BGI",
+        PropertyType.BIG_DECIMAL: "BGF",
+        PropertyType.DATE_TIME: "DAT",
+        PropertyType.URI: "URI",
+        PropertyType.UUID: "UID",
+        PropertyType.CLOB: "CLB",
+        PropertyType.BLOB: "BLB",
+    }
+)
+
+# Reverse mapping: SQLite type abbreviation -> PropertyType (read-only)
+DB_TO_PROPERTY_TYPE: Final[Mapping[str, PropertyType]] = MappingProxyType(
+    {v: k for k, v in PROPERTY_TYPE_TO_DB.items()}
+)
+
+# Hot-path lookup keyed by enum value (see key_by_value)
+_DB_CODE_BY_VALUE: Final[dict[str, str]] = key_by_value(PROPERTY_TYPE_TO_DB)
+
+# Property types whose values are stored natively in value_int and value_real,
+# by enum value. BIG_DECIMAL is kept as text, which keeps every digit
+_INTEGER_TYPE_VALUES: Final[frozenset[str]] = frozenset(
+    {PropertyType.INTEGER._value_, PropertyType.BIG_INTEGER._value_, PropertyType.BOOLEAN._value_}
+)
+_REAL_TYPE_VALUES: Final[frozenset[str]] = frozenset({PropertyType.FLOAT._value_})
+
+# Range of SQLite's INTEGER storage class; larger ints are stored as text
+_INT64_MIN: Final = -(2**63)
+_INT64_MAX: Final = 2**63 - 1
+
+# HierarchyType -> hierarchy_def.type abbreviation
+_HIERARCHY_TYPE_TO_DB: Final[dict[HierarchyType, str]] = {
+    HierarchyType.ENTITY_LIST: "EL",
+    HierarchyType.ENTITY_SET: "ES",
+    HierarchyType.ENTITY_DIR: "ED",
+    HierarchyType.ENTITY_TREE: "ET",
+    HierarchyType.ASPECT_MAP: "AM",
 }
 
-# Reverse mapping: SQLite type abbreviation -> PropertyType
-DB_TO_PROPERTY_TYPE = {v: k for k, v in PROPERTY_TYPE_TO_DB.items()}
+# Most parameters bound to one statement; SQLite's compile-time limit before 3.32
+MAX_VARIABLES = 999
+
+# A parameterized statement, as accepted by SqliteAdapter.execute_batch
+Statement = tuple[str, tuple[Any, ...]]
+
+# The statements are module constants so that every call passes sqlite3 the
+# very same string, which its per-connection statement cache then matches
+# without re-preparing the statement
+
+# Definitions are updated in place on conflict. INSERT OR REPLACE would delete
+# the existing row first, cascading to every row that references it (a
+# catalog's entities, an aspect def's aspects) and renumbering property_def ids.
+# Only rows that actually changed are updated, so re-saving unchanged
+# definitions writes no pages and leaves updated_at alone; IS NOT compares
+# NULLs (default_value) as equal
+UPSERT_CATALOG_SQL = """
+INSERT INTO catalog (id, species, version)
+VALUES (?, ?, ?)
+ON CONFLICT (id) DO UPDATE
+SET species = excluded.species, version = excluded.version, updated_at = datetime('now')
+WHERE (catalog.species, catalog.version) IS NOT (excluded.species, excluded.version)
+"""
+
+UPSERT_ASPECT_DEF_SQL = """
+INSERT INTO aspect_def
+(id, name, is_readable, is_writable, can_add_properties, can_remove_properties)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE
+SET name = excluded.name,
+    is_readable = excluded.is_readable,
+    is_writable = excluded.is_writable,
+    can_add_properties = excluded.can_add_properties,
+    can_remove_properties = excluded.can_remove_properties
+WHERE (aspect_def.name, aspect_def.is_readable, aspect_def.is_writable,
+       aspect_def.can_add_properties, aspect_def.can_remove_properties)
+    IS NOT (excluded.name, excluded.is_readable, excluded.is_writable,
+            excluded.can_add_properties, excluded.can_remove_properties)
+"""
+
+INSERT_CATALOG_ASPECT_DEF_SQL = """
+INSERT OR IGNORE INTO catalog_aspect_def (catalog_id, aspect_def_id)
+VALUES (?, ?)
+"""
+
+UPSERT_PROPERTY_DEF_SQL = """
+INSERT INTO property_def
+(aspect_def_id, name, type, is_writable, is_nullable, is_multivalued, default_value)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (aspect_def_id, name) DO UPDATE
+SET type = excluded.type,
+    is_writable = excluded.is_writable,
+    is_nullable = excluded.is_nullable,
+    is_multivalued = excluded.is_multivalued,
+    default_value = excluded.default_value
+WHERE (property_def.type, property_def.is_writable, property_def.is_nullable,
+       property_def.is_multivalued, property_def.default_value)
+    IS NOT (excluded.type, excluded.is_writable, excluded.is_nullable,
+            excluded.is_multivalued, excluded.default_value)
+"""
+
+# With the audit schema, aspect_def and property_def have an updated_at column
+# too (catalog always has one). These variants stamp it whenever the upsert
+# changes a row; no triggers are involved
+UPSERT_ASPECT_DEF_AUDIT_SQL = UPSERT_ASPECT_DEF_SQL.replace(
+    "\nSET ", "\nSET updated_at = datetime('now'),\n    ", 1
+)
+UPSERT_PROPERTY_DEF_AUDIT_SQL = UPSERT_PROPERTY_DEF_SQL.replace(
+    "\nSET ", "\nSET updated_at = datetime('now'),\n    ", 1
+)
+
+SELECT_AUDIT_COLUMN_SQL = "SELECT 1 FROM pragma_table_info('aspect_def') WHERE name = 'updated_at'"
+
+UPSERT_HIERARCHY_DEF_SQL = """
+INSERT INTO hierarchy_def (catalog_id, name, type)
+VALUES (?, ?, ?)
+ON CONFLICT (catalog_id, name) DO UPDATE
+SET type = excluded.type
+WHERE hierarchy_def.type IS NOT excluded.type
+"""
+
+# Unlike the definition upserts above, re-saving an entity replaces it: the
+# delete cascades to its old aspects and property values, which are then
+# inserted afresh
+UPSERT_ENTITY_SQL = """
+INSERT OR REPLACE INTO entity (id, catalog_id)
+VALUES (?, ?)
+"""
+
+INSERT_ASPECT_SQL = """
+INSERT INTO aspect (entity_id, aspect_def_id)
+VALUES (?, ?)
+"""
+
+SELECT_ASPECT_IDS_SQL = """
+SELECT entity_id, aspect_def_id, id FROM aspect
+WHERE entity_id IN ({placeholders})
+"""
+
+SELECT_PROPERTY_DEF_IDS_SQL = """
+SELECT aspect_def_id, name, id FROM property_def
+WHERE aspect_def_id IN ({placeholders})
+"""
+
+_PROPERTY_VALUE_COLUMNS = (
+    "aspect_id, property_def_id, value_int, value_real, value_text, value_binary"
+)
+
+INSERT_PROPERTY_VALUE_SQL = f"""
+INSERT INTO property_value ({_PROPERTY_VALUE_COLUMNS})
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# property_value rows written by one multi-row INSERT, six parameters each
+PROPERTY_VALUE_ROWS_PER_INSERT = MAX_VARIABLES // 6
+
+INSERT_PROPERTY_VALUES_SQL = (
+    f"INSERT INTO property_value ({_PROPERTY_VALUE_COLUMNS})\nVALUES "
+    + ", ".join(["(?, ?, ?, ?, ?, ?)"] * PROPERTY_VALUE_ROWS_PER_INSERT)
+)
+
+SELECT_ASPECT_DEFS_SQL = """
+SELECT ad.id, ad.name, ad.is_readable, ad.is_writable,
+       ad.can_add_properties, ad.can_remove_properties
+FROM aspect_def ad
+JOIN catalog_aspect_def cad ON ad.id = cad.aspect_def_id
+WHERE cad.catalog_id = ?
+"""
+
+SELECT_PROPERTY_DEFS_SQL = """
+SELECT pd.aspect_def_id, pd.name, pd.type, pd.is_writable, pd.is_nullable,
+       pd.is_multivalued, pd.default_value
+FROM property_def pd
+JOIN catalog_aspect_def cad ON pd.aspect_def_id = cad.aspect_def_id
+WHERE cad.catalog_id = ?
+ORDER BY pd.id
+"""
+
+SELECT_CATALOG_SQL = "SELECT id, species, version FROM catalog WHERE id = ?"
+
+DELETE_CATALOG_SQL = "DELETE FROM catalog WHERE id = ?"
 
 
 class SqliteDao:
@@ -49,9 +228,11 @@ class SqliteDao:
     - Entities with aspects and properties
     - Hierarchy content
 
-    All operations are wrapped in transactions for consistency.
+    All write operations run in explicit transactions for consistency.
     """
 
+    __slots__ = ("_adapter", "_audit")
+
     def __init__(self, adapter: SqliteAdapter) -> None:
         """
         Initialize DAO with a database adapter.
@@ -60,8 +241,16 @@ class SqliteDao:
             adapter: Connected SqliteAdapter instance.
         """
         self._adapter = adapter
+        # Whether the schema has the audit columns; looked up on first save
+        self._audit: bool | None = None
 
-    async def save_catalog(self, catalog: Catalog) -> None:
+    async def save_catalog(
+        self,
+        catalog: Catalog,
+        *,
+        entities: Iterable[Entity] = (),
+        bulk: bool = False,
+    ) -> None:
         """
         Save a complete catalog to the database.
 
@@ -69,38 +258,76 @@ class SqliteDao:
         - Catalog metadata
         - All aspect definitions
         - All hierarchy definitions
-        - All entities with their aspects
+        - The given entities with their aspects and property values
 
         Args:
             catalog: Catalog to save.
+            entities: Entities of the catalog to save. Re-saving an entity
+                replaces its aspects and property values.
+            bulk: If True and entities are given, drop the secondary indexes
+                before writing the entities and create them again before
+                committing, then ANALYZE the database. Only worth it when the
+                entities far outnumber the rows already stored, since every
+                index is rebuilt over all existing rows too.
 
         Raises:
-            aiosqlite.Error: If save operation fails.
+            sqlite3.Error: If save operation fails.
         """
         conn = await self._adapter.get_connection()
 
+        # The writes are collected first and then run as one batch, so the
+        # whole catalog costs a single hop to the connection's thread
+        batch: list[Statement] = []
+
+        # The catalog id is read and converted once, then handed to every
+        # helper that writes a row referencing it
+        catalog_id = catalog.global_id.bytes
+
+        # Save catalog metadata
+        self._save_catalog_metadata(batch, catalog, catalog_id)
+        audit = await self._has_audit_columns(conn)
+
+        # Save aspect definitions
+        aspect_defs = getattr(catalog, "_aspect_defs", {})
+        for aspect_def in aspect_defs.values():
+            self._save_aspect_def(batch, catalog_id, aspect_def, audit)
+
+        # Save hierarchy definitions
+        hierarchy_defs = getattr(catalog, "_hierarchy_defs", {})
+        for hierarchy_def in hierarchy_defs.values():
+            self._save_hierarchy_def(batch, catalog_id, hierarchy_def)
+
+        # Rebuilding the indexes only pays off over many entity rows
+        entities = list(entities)
+        bulk = bulk and bool(entities)
+        if bulk:
+            # DDL is transactional in SQLite, so a failed save also restores
+            # the indexes
+            batch.extend((sql, ()) for sql in DROP_SECONDARY_INDEXES)
+
+        # One write transaction for the whole save, so its changes reach the
+        # journal with a single sync on COMMIT. IMMEDIATE takes the write lock
+        # up front; a deferred BEGIN could fail with SQLITE_BUSY halfway through
+        # when upgrading its read lock while another connection writes
+        await conn.execute("BEGIN IMMEDIATE")
         try:
-            # Save catalog metadata
-            await self._save_catalog_metadata(conn, catalog)
-
-            # Save aspect definitions
-            aspect_defs = getattr(catalog, "_aspect_defs", {})
-            for aspect_def in aspect_defs.values():
-                await self._save_aspect_def(conn, catalog, aspect_def)
+            await self._adapter.execute_batch(batch)
 
-            # Save hierarchy definitions
-            hierarchy_defs = getattr(catalog, "_hierarchy_defs", {})
-            for hierarchy_def in hierarchy_defs.values():
-                await self._save_hierarchy_def(conn, catalog, hierarchy_def)
+            # Save entities, in the same transaction
+            await self._save_entities(conn, catalog_id, entities)
 
-            # Save entities (implementation would iterate through catalog entities)
-            # Note: This requires access to catalog's entities, which may be in hierarchies
+            if bulk:
+                await self._adapter.execute_batch((sql, ()) for sql in SECONDARY_INDEXES)
 
             await conn.commit()
         except Exception:
             await conn.rollback()
             raise
 
+        if bulk:
+            # Refresh the planner statistics for the rebuilt indexes
+            await conn.execute("ANALYZE")
+
     async def load_catalog(self, catalog_id: UUID) -> Catalog:
         """
         Load a complete catalog from the database.
@@ -115,16 +342,11 @@ class SqliteDao:
             ValueError: If catalog not found.
             aiosqlite.Error: If load operation fails.
         """
-        from cheap.core.catalog_impl import CatalogImpl
-        from cheap.core.catalog_species import CatalogSpecies
 
         conn = await self._adapter.get_connection()
 
         # Load catalog metadata
-        cursor = await conn.execute(
-            "SELECT id, species, version FROM catalog WHERE id = ?",
-            (str(catalog_id),),
-        )
+        cursor = await conn.execute(SELECT_CATALOG_SQL, (catalog_id.bytes,))
         row = await cursor.fetchone()
         await cursor.close()
 
@@ -132,7 +354,7 @@ class SqliteDao:
             raise ValueError(f"Catalog not found: {catalog_id}")
 
         catalog = CatalogImpl(
-            global_id=UUID(row[0]),
+            global_id=UUID(bytes=row[0]),
             species=CatalogSpecies(row[1]),
             version=row[2],
         )
@@ -160,8 +382,9 @@ class SqliteDao:
         """
         conn = await self._adapter.get_connection()
 
+        await conn.execute("BEGIN IMMEDIATE")
         try:
-            await conn.execute("DELETE FROM catalog WHERE id = ?", (str(catalog_id),))
+            await conn.execute(DELETE_CATALOG_SQL, (catalog_id.bytes,))
             await conn.commit()
         except Exception:
             await conn.rollback()
@@ -169,266 +392,259 @@ class SqliteDao:
 
     # Private helper methods
 
-    async def _save_catalog_metadata(self, conn: aiosqlite.Connection, catalog: Catalog) -> None:
-        """Save catalog metadata to database."""
-        catalog_id = getattr(catalog, "global_id", getattr(catalog, "id", None))
+    async def _has_audit_columns(self, conn: aiosqlite.Connection) -> bool:
+        """Check, once per DAO, whether the schema was created with the audit columns."""
+        if self._audit is None:
+            cursor = await conn.execute(SELECT_AUDIT_COLUMN_SQL)
+            self._audit = await cursor.fetchone() is not None
+            await cursor.close()
+        return self._audit
 
-        await conn.execute(
-            """
-            INSERT OR REPLACE INTO catalog (id, species, version)
-            VALUES (?, ?, ?)
-            """,
-            (str(catalog_id), catalog.species.value, catalog.version),
-        )
+    def _save_catalog_metadata(
+        self, batch: list[Statement], catalog: Catalog, catalog_id: bytes
+    ) -> None:
+        """Add the catalog metadata write to a batch."""
+        batch.append((UPSERT_CATALOG_SQL, (catalog_id, catalog.species.value, catalog.version)))
 
-    async def _save_aspect_def(
+    def _save_aspect_def(
         self,
-        conn: aiosqlite.Connection,
-        catalog: Catalog,
+        batch: list[Statement],
+        catalog_id: bytes,
         aspect_def: AspectDef,
+        audit: bool,
     ) -> None:
-        """Save an aspect definition to database."""
+        """Add the writes for an aspect definition to a batch."""
         # Save aspect_def record
-        await conn.execute(
-            """
-            INSERT OR REPLACE INTO aspect_def
-            (id, name, is_readable, is_writable, can_add_properties, can_remove_properties)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+        batch.append(
             (
-                str(aspect_def.id),
-                aspect_def.name,
-                1 if aspect_def.is_readable else 0,
-                1 if aspect_def.is_writable else 0,
-                1 if aspect_def.can_add_properties else 0,
-                1 if aspect_def.can_remove_properties else 0,
-            ),
+                UPSERT_ASPECT_DEF_AUDIT_SQL if audit else UPSERT_ASPECT_DEF_SQL,
+                (
+                    aspect_def.id.bytes,
+                    aspect_def.name,
+                    1 if aspect_def.is_readable else 0,
+                    1 if aspect_def.is_writable else 0,
+                    1 if aspect_def.can_add_properties else 0,
+                    1 if aspect_def.can_remove_properties else 0,
+                ),
+            )
         )
 
         # Link to catalog
-        catalog_id = getattr(catalog, "global_id", getattr(catalog, "id", None))
-        await conn.execute(
-            """
-            INSERT OR IGNORE INTO catalog_aspect_def (catalog_id, aspect_def_id)
-            VALUES (?, ?)
-            """,
-            (str(catalog_id), str(aspect_def.id)),
-        )
+        batch.append((INSERT_CATALOG_ASPECT_DEF_SQL, (catalog_id, aspect_def.id.bytes)))
 
         # Save property definitions
         for prop_def in aspect_def.properties.values():
-            await self._save_property_def(conn, aspect_def, prop_def)
+            self._save_property_def(batch, aspect_def, prop_def, audit)
 
-    async def _save_property_def(
+    def _save_property_def(
         self,
-        conn: aiosqlite.Connection,
+        batch: list[Statement],
         aspect_def: AspectDef,
         prop_def: PropertyDef,
+        audit: bool,
     ) -> None:
-        """Save a property definition to database."""
-        db_type = PROPERTY_TYPE_TO_DB[prop_def.property_type]
-
-        await conn.execute(
-            """
-            INSERT OR REPLACE INTO property_def
-            (aspect_def_id, name, type, is_writable, is_nullable, is_multivalued, default_value)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+        """Add the write for a property definition to a batch."""
+        db_type = _DB_CODE_BY_VALUE[prop_def.property_type._value_]
+
+        batch.append(
             (
-                str(aspect_def.id),
-                prop_def.name,
-                db_type,
-                1 if prop_def.is_writable else 0,
-                1 if prop_def.is_nullable else 0,
-                1 if prop_def.is_multivalued else 0,
-                str(prop_def.default_value) if prop_def.default_value is not None else None,
-            ),
+                UPSERT_PROPERTY_DEF_AUDIT_SQL if audit else UPSERT_PROPERTY_DEF_SQL,
+                (
+                    aspect_def.id.bytes,
+                    prop_def.name,
+                    db_type,
+                    1 if prop_def.is_writable else 0,
+                    1 if prop_def.is_nullable else 0,
+                    1 if prop_def.is_multivalued else 0,
+                    str(prop_def.default_value) if prop_def.default_value is not None else None,
+                ),
+            )
         )
 
-    async def _save_hierarchy_def(
+    def _save_hierarchy_def(
         self,
-        conn: aiosqlite.Connection,
-        catalog: Catalog,
+        batch: list[Statement],
+        catalog_id: bytes,
         hierarchy_def: Any,  # HierarchyDef type
     ) -> None:
-        """Save a hierarchy definition to database."""
-        from cheap.core.hierarchy_type import HierarchyType
-
-        catalog_id = getattr(catalog, "global_id", getattr(catalog, "id", None))
-
-        # Map HierarchyType to DB abbreviation
-        type_map = {
-            HierarchyType.ENTITY_LIST: "EL",
-            HierarchyType.ENTITY_SET: "ES",
-            HierarchyType.ENTITY_DIR: "ED",
-            HierarchyType.ENTITY_TREE: "ET",
-            HierarchyType.ASPECT_MAP: "AM",
-        }
-
-        db_type = type_map[hierarchy_def.hierarchy_type]
-
-        await conn.execute(
-            """
-            INSERT OR REPLACE INTO hierarchy_def (catalog_id, name, type)
-            VALUES (?, ?, ?)
-            """,
-            (str(catalog_id), hierarchy_def.name, db_type),
-        )
+        """Add the write for a hierarchy definition to a batch."""
+        db_type = _HIERARCHY_TYPE_TO_DB[hierarchy_def.hierarchy_type]
+
+        batch.append((UPSERT_HIERARCHY_DEF_SQL, (catalog_id, hierarchy_def.name, db_type)))
 
-    async def _save_entity(
-        self, conn: aiosqlite.Connection, catalog: Catalog, entity: Entity
+    async def _save_entities(
+        self, conn: aiosqlite.Connection, catalog_id: bytes, entities: Iterable[Entity]
     ) -> None:
-        """Save an entity and its aspects to database."""
-        catalog_id = getattr(catalog, "global_id", getattr(catalog, "id", None))
-
-        # Save entity record
-        await conn.execute(
-            """
-            INSERT OR REPLACE INTO entity (id, catalog_id)
-            VALUES (?, ?)
-            """,
-            (str(entity.id), str(catalog_id)),
+        """
+        Save entities with their aspects and property values to database.
+
+        The entity and aspect rows are collected first and written as one
+        batch, so the connection thread is crossed once rather than once per
+        row. The new aspect ids and the property_def ids are then read back
+        with one query each, instead of a RETURNING per aspect and a lookup per
+        property value. Runs in the caller's transaction.
+        """
+        entity_rows: list[tuple[bytes, bytes]] = []
+        aspects: list[tuple[bytes, bytes, Aspect]] = []
+        for entity in entities:
+            entity_id = entity.id.bytes
+            entity_rows.append((entity_id, catalog_id))
+            for aspect in entity.aspects.values():
+                aspects.append((entity_id, aspect.definition.id.bytes, aspect))
+
+        if not entity_rows:
+            return
+
+        # Save entity and aspect records
+        await self._adapter.execute_batch(
+            [
+                *((UPSERT_ENTITY_SQL, row) for row in entity_rows),
+                *(
+                    (INSERT_ASPECT_SQL, (entity_id, aspect_def_id))
+                    for entity_id, aspect_def_id, _ in aspects
+                ),
+            ]
         )
 
-        # Save aspects
-        for aspect in entity.aspects.values():
-            await self._save_aspect(conn, entity, aspect)
+        if not aspects:
+            return
 
-    async def _save_aspect(
-        self, conn: aiosqlite.Connection, entity: Entity, aspect: Aspect
-    ) -> None:
-        """Save an aspect and its property values to database."""
-        # Save aspect record
-        cursor = await conn.execute(
-            """
-            INSERT INTO aspect (entity_id, aspect_def_id)
-            VALUES (?, ?)
-            RETURNING id
-            """,
-            (str(entity.id), str(aspect.definition.id)),
+        # Read the ids back for just these entities
+        rows = await self._fetch_in(
+            conn, SELECT_ASPECT_IDS_SQL, [entity_id for entity_id, _ in entity_rows]
         )
-        row = await cursor.fetchone()
-        if row is None:
-            raise ValueError(f"Failed to insert aspect for entity {entity.id}")
-        aspect_id = row[0]
-        await cursor.close()
+        aspect_ids = {(row[0], row[1]): row[2] for row in rows}
+
+        rows = await self._fetch_in(
+            conn,
+            SELECT_PROPERTY_DEF_IDS_SQL,
+            list({aspect_def_id for _, aspect_def_id, _ in aspects}),
+        )
+        property_def_ids = {(row[0], row[1]): row[2] for row in rows}
 
         # Save property values
-        aspect_def_id = str(aspect.definition.id)
-        for prop_name, prop_def in aspect.definition.properties.items():
-            prop = aspect.get_property(prop_name)
-            if prop is not None and prop.value is not None:
-                await self._save_property_value(
-                    conn, aspect_id, aspect_def_id, prop_def, prop.value
-                )
-
-    async def _save_property_value(
+        value_rows: list[tuple[Any, ...]] = []
+        for entity_id, aspect_def_id, aspect in aspects:
+            aspect_id = aspect_ids[(entity_id, aspect_def_id)]
+            for prop_name, prop_def in aspect.definition.properties.items():
+                prop = aspect.get_property(prop_name)
+                if prop is not None and prop.value is not None:
+                    value_rows.append(
+                        self._property_value_row(
+                            aspect_id, property_def_ids, aspect_def_id, prop_def, prop.value
+                        )
+                    )
+
+        if value_rows:
+            await self._save_property_values(value_rows)
+
+    async def _save_property_values(self, rows: list[tuple[Any, ...]]) -> None:
+        """
+        Insert property_value rows with multi-row INSERT statements.
+
+        Rows go in PROPERTY_VALUE_ROWS_PER_INSERT at a time, so SQLite steps
+        one statement per chunk instead of one per row, which roughly halves
+        the insert time compared to executemany. The rows of a last partial
+        chunk are inserted one by one, keeping the set of distinct statements
+        (and so the statement cache) small. All statements run as one batch.
+        """
+        per_insert = PROPERTY_VALUE_ROWS_PER_INSERT
+        full = len(rows) - len(rows) % per_insert
+        batch: list[Statement] = [
+            (
+                INSERT_PROPERTY_VALUES_SQL,
+                tuple(chain.from_iterable(rows[start : start + per_insert])),
+            )
+            for start in range(0, full, per_insert)
+        ]
+        batch.extend((INSERT_PROPERTY_VALUE_SQL, row) for row in rows[full:])
+        await self._adapter.execute_batch(batch)
+
+    async def _fetch_in(
+        self, conn: aiosqlite.Connection, sql: str, values: Sequence[Any]
+    ) -> list[Any]:
+        """
+        Fetch the rows of a query whose IN list is bound to the given values.
+
+        The {placeholders} field of sql is filled with one parameter per value,
+        in chunks of at most MAX_VARIABLES, so the query runs once per chunk.
+        """
+        rows: list[Any] = []
+        for start in range(0, len(values), MAX_VARIABLES):
+            chunk = values[start : start + MAX_VARIABLES]
+            cursor = await conn.execute(sql.format(placeholders=", ".join("?" * len(chunk))), chunk)
+            rows.extend(await cursor.fetchall())
+            await cursor.close()
+        return rows
+
+    def _property_value_row(
         self,
-        conn: aiosqlite.Connection,
         aspect_id: int,
-        aspect_def_id: str,
+        property_def_ids: dict[tuple[bytes, str], int],
+        aspect_def_id: bytes,
         prop_def: PropertyDef,
         value: Any,
-    ) -> None:
-        """Save a property value to database."""
-        # Get property_def id from database
-        cursor = await conn.execute(
-            """
-            SELECT id FROM property_def
-            WHERE aspect_def_id = ? AND name = ?
-            """,
-            (aspect_def_id, prop_def.name),
-        )
-        row = await cursor.fetchone()
-        await cursor.close()
+    ) -> tuple[int, int, int | None, float | None, str | None, bytes | None]:
+        """
+        Build the property_value parameter row for a single property value.
 
-        if row is None:
+        The value goes into the column of its native SQLite storage class:
+        integers and booleans into value_int, floats into value_real, BLOBs
+        into value_binary and everything else, as a string, into value_text.
+        """
+        property_def_id = property_def_ids.get((aspect_def_id, prop_def.name))
+        if property_def_id is None:
             raise ValueError(f"Property definition not found: {prop_def.name}")
 
-        property_def_id = row[0]
-
-        # Determine how to store the value
-        if prop_def.property_type == PropertyType.BLOB:
-            # Store as binary
-            value_text = None
+        type_value = prop_def.property_type._value_
+        if type_value in _INTEGER_TYPE_VALUES:
+            value = int(value)
+            if _INT64_MIN <= value <= _INT64_MAX:
+                return (aspect_id, property_def_id, value, None, None, None)
+            return (aspect_id, property_def_id, None, None, str(value), None)
+        if type_value in _REAL_TYPE_VALUES:
+            return (aspect_id, property_def_id, None, float(value), None, None)
+        if prop_def.property_type is PropertyType.BLOB:
             value_binary = value if isinstance(value, bytes) else str(value).encode()
-        else:
-            # Store as text (convert to string)
-            value_text = str(value)
-            value_binary = None
-
-        await conn.execute(
-            """
-            INSERT INTO property_value (aspect_id, property_def_id, value_text, value_binary)
-            VALUES (?, ?, ?, ?)
-            """,
-            (aspect_id, property_def_id, value_text, value_binary),
-        )
+            return (aspect_id, property_def_id, None, None, None, value_binary)
+        return (aspect_id, property_def_id, None, None, str(value), None)
 
     async def _load_aspect_defs(self, conn: aiosqlite.Connection, catalog: Catalog) -> None:
         """Load aspect definitions for a catalog."""
-        from cheap.core.aspect_impl import AspectDefImpl
-        from cheap.core.property_impl import PropertyDefImpl
-
-        catalog_id = getattr(catalog, "global_id", getattr(catalog, "id", None))
-
-        # Load aspect defs linked to this catalog
-        cursor = await conn.execute(
-            """
-            SELECT ad.id, ad.name, ad.is_readable, ad.is_writable,
-                   ad.can_add_properties, ad.can_remove_properties
-            FROM aspect_def ad
-            JOIN catalog_aspect_def cad ON ad.id = cad.aspect_def_id
-            WHERE cad.catalog_id = ?
-            """,
-            (str(catalog_id),),
-        )
-
-        rows = await cursor.fetchall()
-        await cursor.close()
-
-        for row in rows:
-            aspect_def_id = UUID(row[0])
-            aspect_name = row[1]
-
-            # Load property definitions for this aspect
-            prop_cursor = await conn.execute(
-                """
-                SELECT name, type, is_writable, is_nullable, is_multivalued, default_value
-                FROM property_def
-                WHERE aspect_def_id = ?
-                """,
-                (str(aspect_def_id),),
+        catalog_id = catalog.global_id.bytes
+
+        # Load the property definitions of all the catalog's aspect defs in one
+        # query rather than one per aspect def, grouped by aspect def in Python.
+        # Both queries stream their rows (iter_chunk_size at a time) instead of
+        # materializing them with fetchall, building objects as rows arrive.
+        cursor = await conn.execute(SELECT_PROPERTY_DEFS_SQL, (catalog_id,))
+        properties_by_aspect_def: dict[bytes, dict[str, PropertyDef]] = {}
+        async for prop_row in cursor:
+            prop_def = PropertyDefImpl(
+                name=prop_row[1],
+                property_type=DB_TO_PROPERTY_TYPE[prop_row[2]],
+                is_writable=bool(prop_row[3]),
+                is_nullable=bool(prop_row[4]),
+                is_multivalued=bool(prop_row[5]),
+                default_value=prop_row[6],
             )
+            properties_by_aspect_def.setdefault(prop_row[0], {})[prop_def.name] = prop_def
+        await cursor.close()
 
-            prop_rows = await prop_cursor.fetchall()
-            await prop_cursor.close()
-
-            properties = {}
-            for prop_row in prop_rows:
-                prop_type = DB_TO_PROPERTY_TYPE[prop_row[1]]
-                prop_def = PropertyDefImpl(
-                    name=prop_row[0],
-                    property_type=prop_type,
-                    is_writable=bool(prop_row[2]),
-                    is_nullable=bool(prop_row[3]),
-                    is_multivalued=bool(prop_row[4]),
-                    default_value=prop_row[5],
-                )
-                properties[prop_def.name] = prop_def
-
-            # Create aspect definition
+        # Load aspect defs linked to this catalog
+        cursor = await conn.execute(SELECT_ASPECT_DEFS_SQL, (catalog_id,))
+        async for row in cursor:
             aspect_def = AspectDefImpl(
-                id=aspect_def_id,
-                name=aspect_name,
-                properties=properties,
+                id=UUID(bytes=row[0]),
+                name=row[1],
+                properties=properties_by_aspect_def.get(row[0], {}),
                 is_readable=bool(row[2]),
                 is_writable=bool(row[3]),
                 can_add_properties=bool(row[4]),
                 can_remove_properties=bool(row[5]),
             )
-
             catalog.add_aspect_def(aspect_def)
+        await cursor.close()
 
     async def _load_hierarchy_defs(self, conn: aiosqlite.Connection, catalog: Catalog) -> None:
         """Load hierarchy definitions for a catalog."""
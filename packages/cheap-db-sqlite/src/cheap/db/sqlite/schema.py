@@ -2,20 +2,65 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 if TYPE_CHECKING:
     import aiosqlite
 
 
-# Main schema DDL - ported from sqlite-cheap.sql
-SCHEMA_DDL = """
+# Per-connection settings for write throughput and read speed. In WAL mode
+# synchronous=NORMAL only syncs at checkpoints rather than on every commit: a
+# power loss may drop the last few committed transactions, but never corrupts
+# the database. journal_mode persists in the database file (in-memory databases
+# ignore it); the rest must be set again on every connection.
+PERFORMANCE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    # Negative sizes are in KiB: a page cache of about 64 MB
+    "PRAGMA cache_size = -64000",
+    # Bytes of the database file SQLite may memory-map for reads (256 MB)
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Everything a new connection runs before first use, as a single script so it
+# costs one hop to the connection's thread rather than one per PRAGMA
+CONNECTION_INIT_SCRIPT = "".join(
+    f"{pragma};\n" for pragma in ("PRAGMA foreign_keys = ON", *PERFORMANCE_PRAGMAS)
+)
+
+# UUID-valued columns of each table. They hold the 16 raw bytes of the UUID
+# (uuid.bytes) as a BLOB, less than half the size of the 36 character text form
+# in every row and index entry
+UUID_COLUMNS: dict[str, tuple[str, ...]] = {
+    "aspect_def": ("id",),
+    "property_def": ("aspect_def_id",),
+    "catalog": ("id",),
+    "catalog_aspect_def": ("catalog_id", "aspect_def_id"),
+    "hierarchy_def": ("catalog_id",),
+    "entity": ("id", "catalog_id"),
+    "hierarchy": ("id", "catalog_id"),
+    "aspect": ("entity_id", "aspect_def_id"),
+    "hierarchy_entity_list": ("hierarchy_id", "entity_id"),
+    "hierarchy_entity_set": ("hierarchy_id", "entity_id"),
+    "hierarchy_entity_directory": ("hierarchy_id", "entity_id"),
+    "hierarchy_entity_tree_node": ("hierarchy_id", "node_id", "entity_id", "parent_node_id"),
+    "hierarchy_aspect_map": ("hierarchy_id", "entity_id"),
+}
+
+# Main schema DDL - ported from sqlite-cheap.sql. The link and hierarchy
+# content tables, keyed by a composite primary key, are WITHOUT ROWID: their
+# rows live in the primary key B-tree itself, rather than in a rowid table
+# plus a separate index for the key. Columns leading a primary key or UNIQUE
+# constraint get no index of their own; the constraint's index serves them.
+_TABLES_DDL = """
 -- Enable foreign key support
 PRAGMA foreign_keys = ON;
 
 -- Aspect Definition Table
 CREATE TABLE IF NOT EXISTS aspect_def (
-    id TEXT PRIMARY KEY,
+    id BLOB PRIMARY KEY,
     name TEXT NOT NULL UNIQUE,
     is_readable INTEGER NOT NULL DEFAULT 1 CHECK (is_readable IN (0, 1)),
     is_writable INTEGER NOT NULL DEFAULT 1 CHECK (is_writable IN (0, 1)),
@@ -23,12 +68,10 @@ CREATE TABLE IF NOT EXISTS aspect_def (
     can_remove_properties INTEGER NOT NULL DEFAULT 0 CHECK (can_remove_properties IN (0, 1))
 );
 
-CREATE INDEX IF NOT EXISTS idx_aspect_def_name ON aspect_def(name);
-
 -- Property Definition Table
 CREATE TABLE IF NOT EXISTS property_def (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    aspect_def_id TEXT NOT NULL,
+    aspect_def_id BLOB NOT NULL,
     name TEXT NOT NULL,
     type TEXT NOT NULL CHECK (type IN ('INT', 'FLT', 'BLN', 'STR', 'TXT', 'BGI', 'BGF', 'DAT', 'URI', 'UID', 'CLB', 'BLB')),
     is_writable INTEGER NOT NULL DEFAULT 1 CHECK (is_writable IN (0, 1)),
@@ -39,167 +82,164 @@ CREATE TABLE IF NOT EXISTS property_def (
     UNIQUE (aspect_def_id, name)
 );
 
-CREATE INDEX IF NOT EXISTS idx_property_def_aspect_def ON property_def(aspect_def_id);
-CREATE INDEX IF NOT EXISTS idx_property_def_name ON property_def(aspect_def_id, name);
-
 -- Catalog Table
 CREATE TABLE IF NOT EXISTS catalog (
-    id TEXT PRIMARY KEY,
+    id BLOB PRIMARY KEY,
     species TEXT NOT NULL CHECK (species IN ('SOURCE', 'SINK', 'MIRROR', 'CACHE', 'CLONE', 'FORK')),
     version TEXT NOT NULL,
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now'))
 );
 
-CREATE INDEX IF NOT EXISTS idx_catalog_species ON catalog(species);
-
 -- Catalog-AspectDef Link Table
 CREATE TABLE IF NOT EXISTS catalog_aspect_def (
-    catalog_id TEXT NOT NULL,
-    aspect_def_id TEXT NOT NULL,
+    catalog_id BLOB NOT NULL,
+    aspect_def_id BLOB NOT NULL,
     FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
     FOREIGN KEY (aspect_def_id) REFERENCES aspect_def(id) ON DELETE CASCADE,
     PRIMARY KEY (catalog_id, aspect_def_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_catalog_aspect_def_catalog ON catalog_aspect_def(catalog_id);
-CREATE INDEX IF NOT EXISTS idx_catalog_aspect_def_aspect ON catalog_aspect_def(aspect_def_id);
+) WITHOUT ROWID;
 
 -- Hierarchy Definition Table
 CREATE TABLE IF NOT EXISTS hierarchy_def (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    catalog_id TEXT NOT NULL,
+    catalog_id BLOB NOT NULL,
     name TEXT NOT NULL,
     type TEXT NOT NULL CHECK (type IN ('EL', 'ES', 'ED', 'ET', 'AM')),
     FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
     UNIQUE (catalog_id, name)
 );
 
-CREATE INDEX IF NOT EXISTS idx_hierarchy_def_catalog ON hierarchy_def(catalog_id);
-CREATE INDEX IF NOT EXISTS idx_hierarchy_def_name ON hierarchy_def(catalog_id, name);
-
 -- Entity Table
 CREATE TABLE IF NOT EXISTS entity (
-    id TEXT PRIMARY KEY,
-    catalog_id TEXT NOT NULL,
+    id BLOB PRIMARY KEY,
+    catalog_id BLOB NOT NULL,
     FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_entity_catalog ON entity(catalog_id);
-
 -- Hierarchy Table
 CREATE TABLE IF NOT EXISTS hierarchy (
-    id TEXT PRIMARY KEY,
-    catalog_id TEXT NOT NULL,
+    id BLOB PRIMARY KEY,
+    catalog_id BLOB NOT NULL,
     hierarchy_def_id INTEGER NOT NULL,
     version INTEGER NOT NULL DEFAULT 1,
     FOREIGN KEY (catalog_id) REFERENCES catalog(id) ON DELETE CASCADE,
     FOREIGN KEY (hierarchy_def_id) REFERENCES hierarchy_def(id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_hierarchy_catalog ON hierarchy(catalog_id);
-CREATE INDEX IF NOT EXISTS idx_hierarchy_def ON hierarchy(hierarchy_def_id);
-
 -- Aspect Table
 CREATE TABLE IF NOT EXISTS aspect (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    entity_id TEXT NOT NULL,
-    aspect_def_id TEXT NOT NULL,
+    entity_id BLOB NOT NULL,
+    aspect_def_id BLOB NOT NULL,
     FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
     FOREIGN KEY (aspect_def_id) REFERENCES aspect_def(id) ON DELETE CASCADE,
     UNIQUE (entity_id, aspect_def_id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_aspect_entity ON aspect(entity_id);
-CREATE INDEX IF NOT EXISTS idx_aspect_def ON aspect(aspect_def_id);
-
 -- Property Value Table
 CREATE TABLE IF NOT EXISTS property_value (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     aspect_id INTEGER NOT NULL,
     property_def_id INTEGER NOT NULL,
+    value_int INTEGER,
+    value_real REAL,
     value_text TEXT,
     value_binary BLOB,
     FOREIGN KEY (aspect_id) REFERENCES aspect(id) ON DELETE CASCADE,
     FOREIGN KEY (property_def_id) REFERENCES property_def(id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_property_value_aspect ON property_value(aspect_id);
-CREATE INDEX IF NOT EXISTS idx_property_value_property_def ON property_value(property_def_id);
-CREATE INDEX IF NOT EXISTS idx_property_value_aspect_property ON property_value(aspect_id, property_def_id);
-
 -- Hierarchy Content: Entity List
 CREATE TABLE IF NOT EXISTS hierarchy_entity_list (
-    hierarchy_id TEXT NOT NULL,
-    entity_id TEXT NOT NULL,
+    hierarchy_id BLOB NOT NULL,
+    entity_id BLOB NOT NULL,
     position INTEGER NOT NULL,
     FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
     FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
     PRIMARY KEY (hierarchy_id, position)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hel_hierarchy ON hierarchy_entity_list(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_hel_entity ON hierarchy_entity_list(entity_id);
+) WITHOUT ROWID;
 
 -- Hierarchy Content: Entity Set
 CREATE TABLE IF NOT EXISTS hierarchy_entity_set (
-    hierarchy_id TEXT NOT NULL,
-    entity_id TEXT NOT NULL,
+    hierarchy_id BLOB NOT NULL,
+    entity_id BLOB NOT NULL,
     position INTEGER,
     FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
     FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
     PRIMARY KEY (hierarchy_id, entity_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hes_hierarchy ON hierarchy_entity_set(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_hes_entity ON hierarchy_entity_set(entity_id);
+) WITHOUT ROWID;
 
 -- Hierarchy Content: Entity Directory
 CREATE TABLE IF NOT EXISTS hierarchy_entity_directory (
-    hierarchy_id TEXT NOT NULL,
+    hierarchy_id BLOB NOT NULL,
     key TEXT NOT NULL,
-    entity_id TEXT NOT NULL,
+    entity_id BLOB NOT NULL,
     FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
     FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
     PRIMARY KEY (hierarchy_id, key)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hed_hierarchy ON hierarchy_entity_directory(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_hed_entity ON hierarchy_entity_directory(entity_id);
-CREATE INDEX IF NOT EXISTS idx_hed_key ON hierarchy_entity_directory(hierarchy_id, key);
+) WITHOUT ROWID;
 
 -- Hierarchy Content: Entity Tree Node
 CREATE TABLE IF NOT EXISTS hierarchy_entity_tree_node (
-    hierarchy_id TEXT NOT NULL,
-    node_id TEXT NOT NULL,
-    entity_id TEXT NOT NULL,
-    parent_node_id TEXT,
+    hierarchy_id BLOB NOT NULL,
+    node_id BLOB NOT NULL,
+    entity_id BLOB NOT NULL,
+    parent_node_id BLOB,
     FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
     FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
     -- FOREIGN KEY (parent_node_id) removed due to self-reference complexity
     PRIMARY KEY (hierarchy_id, node_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_hetn_hierarchy ON hierarchy_entity_tree_node(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_hetn_entity ON hierarchy_entity_tree_node(entity_id);
-CREATE INDEX IF NOT EXISTS idx_hetn_parent ON hierarchy_entity_tree_node(parent_node_id);
+) WITHOUT ROWID;
 
 -- Hierarchy Content: Aspect Map
 CREATE TABLE IF NOT EXISTS hierarchy_aspect_map (
-    hierarchy_id TEXT NOT NULL,
-    entity_id TEXT NOT NULL,
+    hierarchy_id BLOB NOT NULL,
+    entity_id BLOB NOT NULL,
     aspect_id INTEGER NOT NULL,
     FOREIGN KEY (hierarchy_id) REFERENCES hierarchy(id) ON DELETE CASCADE,
     FOREIGN KEY (entity_id) REFERENCES entity(id) ON DELETE CASCADE,
     FOREIGN KEY (aspect_id) REFERENCES aspect(id) ON DELETE CASCADE,
     PRIMARY KEY (hierarchy_id, entity_id)
-);
-
-CREATE INDEX IF NOT EXISTS idx_ham_hierarchy ON hierarchy_aspect_map(hierarchy_id);
-CREATE INDEX IF NOT EXISTS idx_ham_entity ON hierarchy_aspect_map(entity_id);
-CREATE INDEX IF NOT EXISTS idx_ham_aspect ON hierarchy_aspect_map(aspect_id);
+) WITHOUT ROWID;
 """
 
+# Secondary (non-key) indexes by name, with the table and columns each covers.
+# Declared here rather than inline in the DDL, so bulk saves can drop and
+# rebuild exactly these. Primary key and UNIQUE indexes are part of their
+# tables and are never dropped.
+SECONDARY_INDEX_COLUMNS: dict[str, str] = {
+    "idx_catalog_species": "catalog(species)",
+    "idx_catalog_aspect_def_aspect": "catalog_aspect_def(aspect_def_id)",
+    "idx_entity_catalog": "entity(catalog_id)",
+    "idx_hierarchy_catalog": "hierarchy(catalog_id)",
+    "idx_hierarchy_def": "hierarchy(hierarchy_def_id)",
+    "idx_aspect_def": "aspect(aspect_def_id)",
+    "idx_property_value_property_def": "property_value(property_def_id)",
+    "idx_property_value_aspect_property": "property_value(aspect_id, property_def_id)",
+    "idx_hel_entity": "hierarchy_entity_list(entity_id)",
+    "idx_hes_entity": "hierarchy_entity_set(entity_id)",
+    "idx_hed_entity": "hierarchy_entity_directory(entity_id)",
+    "idx_hetn_entity": "hierarchy_entity_tree_node(entity_id)",
+    "idx_hetn_parent": "hierarchy_entity_tree_node(parent_node_id)",
+    "idx_ham_entity": "hierarchy_aspect_map(entity_id)",
+    "idx_ham_aspect": "hierarchy_aspect_map(aspect_id)",
+}
+
+# CREATE INDEX statements for SECONDARY_INDEX_COLUMNS
+SECONDARY_INDEXES: tuple[str, ...] = tuple(
+    f"CREATE INDEX IF NOT EXISTS {name} ON {columns}"
+    for name, columns in SECONDARY_INDEX_COLUMNS.items()
+)
+
+# DROP INDEX statements undoing SECONDARY_INDEXES
+DROP_SECONDARY_INDEXES: tuple[str, ...] = tuple(
+    f"DROP INDEX IF EXISTS {name}" for name in SECONDARY_INDEX_COLUMNS
+)
+
+# Main schema DDL: the tables, then their secondary indexes
+SCHEMA_DDL = _TABLES_DDL + "".join(f"{statement};\n" for statement in SECONDARY_INDEXES)
+
 # Audit schema DDL - ported from sqlite-cheap-audit.sql
 AUDIT_DDL = """
 -- Add audit columns to definition tables
@@ -233,53 +273,15 @@ ALTER TABLE hierarchy_entity_directory ADD COLUMN created_at TEXT DEFAULT (datet
 ALTER TABLE hierarchy_entity_tree_node ADD COLUMN created_at TEXT DEFAULT (datetime('now'));
 ALTER TABLE hierarchy_aspect_map ADD COLUMN created_at TEXT DEFAULT (datetime('now'));
 
--- Create triggers for updated_at columns
-CREATE TRIGGER IF NOT EXISTS update_aspect_def_updated_at
-AFTER UPDATE ON aspect_def
-FOR EACH ROW
-BEGIN
-    UPDATE aspect_def SET updated_at = datetime('now') WHERE id = NEW.id;
-END;
-
-CREATE TRIGGER IF NOT EXISTS update_property_def_updated_at
-AFTER UPDATE ON property_def
-FOR EACH ROW
-BEGIN
-    UPDATE property_def SET updated_at = datetime('now') WHERE id = NEW.id;
-END;
-
-CREATE TRIGGER IF NOT EXISTS update_catalog_updated_at
-AFTER UPDATE ON catalog
-FOR EACH ROW
-BEGIN
-    UPDATE catalog SET updated_at = datetime('now') WHERE id = NEW.id;
-END;
-
-CREATE TRIGGER IF NOT EXISTS update_hierarchy_updated_at
-AFTER UPDATE ON hierarchy
-FOR EACH ROW
-BEGIN
-    UPDATE hierarchy SET updated_at = datetime('now') WHERE id = NEW.id;
-END;
-
-CREATE TRIGGER IF NOT EXISTS update_aspect_updated_at
-AFTER UPDATE ON aspect
-FOR EACH ROW
-BEGIN
-    UPDATE aspect SET updated_at = datetime('now') WHERE id = NEW.id;
-END;
-
-CREATE TRIGGER IF NOT EXISTS update_property_value_updated_at
-AFTER UPDATE ON property_value
-FOR EACH ROW
-BEGIN
-    UPDATE property_value SET updated_at = datetime('now') WHERE id = NEW.id;
-END;
+-- updated_at is stamped by the DAO's upserts rather than by AFTER UPDATE
+-- triggers, which cost a second UPDATE of every updated row. Only catalog,
+-- aspect_def and property_def are upserted; the other tables keep the
+-- updated_at of their insert
 """
 
 # Drop schema DDL - ported from sqlite-cheap-drop.sql
 DROP_DDL = """
--- Drop triggers
+-- Drop triggers (created by earlier versions of the audit DDL)
 DROP TRIGGER IF EXISTS update_aspect_def_updated_at;
 DROP TRIGGER IF EXISTS update_property_def_updated_at;
 DROP TRIGGER IF EXISTS update_catalog_updated_at;
@@ -341,14 +343,37 @@ PRAGMA foreign_keys = ON;
 """
 
 
+def _uuid_text_to_blob(value: Any) -> Any:
+    """Return the 16 UUID bytes for a UUID string, and any other value unchanged."""
+    return UUID(value).bytes if isinstance(value, str) else value
+
+
 class SqliteSchema:
     """
     SQLite schema management for the CHEAP data model.
 
     Provides methods to create, drop, and truncate the database schema.
-    Supports optional audit tracking with timestamps and triggers.
+    Supports optional audit columns (created_at, updated_at); updated_at is
+    stamped by the DAO's upserts of catalog, aspect_def and property_def.
     """
 
+    @staticmethod
+    async def init_connection(conn: aiosqlite.Connection) -> None:
+        """
+        Run CONNECTION_INIT_SCRIPT on a new connection.
+
+        Enables foreign keys and applies PERFORMANCE_PRAGMAS in one script.
+        Must be called outside a transaction, since the journal mode cannot be
+        switched to WAL inside one.
+
+        Args:
+            conn: SQLite database connection.
+
+        Raises:
+            aiosqlite.Error: If a PRAGMA fails.
+        """
+        await conn.executescript(CONNECTION_INIT_SCRIPT)
+
     @staticmethod
     async def create_schema(conn: aiosqlite.Connection, *, include_audit: bool = False) -> None:
         """
@@ -356,27 +381,24 @@ class SqliteSchema:
 
         Args:
             conn: SQLite database connection.
-            include_audit: If True, also create audit columns and triggers.
+            include_audit: If True, also create the audit columns.
 
         Raises:
             aiosqlite.Error: If schema creation fails.
         """
-        # Enable foreign keys
-        await conn.execute("PRAGMA foreign_keys = ON")
-
-        # Execute main schema DDL
-        await conn.executescript(SCHEMA_DDL)
-
-        # Optionally add audit functionality
+        # The connection settings, main schema DDL and optional audit
+        # functionality all go in one script
+        script = CONNECTION_INIT_SCRIPT + SCHEMA_DDL
         if include_audit:
-            await conn.executescript(AUDIT_DDL)
+            script += AUDIT_DDL
+        await conn.executescript(script)
 
         await conn.commit()
 
     @staticmethod
     async def drop_schema(conn: aiosqlite.Connection) -> None:
         """
-        Drop all CHEAP database tables and triggers.
+        Drop all CHEAP database tables, and any audit triggers left by earlier versions.
 
         Args:
             conn: SQLite database connection.
@@ -408,6 +430,40 @@ class SqliteSchema:
 
         await conn.commit()
 
+    @staticmethod
+    async def migrate_uuids_to_blob(conn: aiosqlite.Connection) -> None:
+        """
+        Convert UUIDs stored as text by earlier versions to 16-byte BLOBs.
+
+        Rewrites every UUID_COLUMNS value that is still text, in a single
+        transaction; values that already are BLOBs are left alone, so running
+        it again is harmless. The declared column types of an existing
+        database are not changed, which SQLite does not need: a TEXT column
+        keeps BLOB values as they are. Foreign key enforcement is switched off
+        while parent and child keys are rewritten one table at a time.
+
+        Args:
+            conn: SQLite database connection, not inside a transaction.
+
+        Raises:
+            aiosqlite.Error: If the migration fails, e.g. because a text value
+                is not a valid UUID; no value is changed then.
+        """
+        await conn.create_function("cheap_uuid_blob", 1, _uuid_text_to_blob, deterministic=True)
+        await conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table, columns in UUID_COLUMNS.items():
+                    assignments = ", ".join(f"{col} = cheap_uuid_blob({col})" for col in columns)
+                    await conn.execute(f"UPDATE {table} SET {assignments}")
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        finally:
+            await conn.execute("PRAGMA foreign_keys = ON")
+
     @staticmethod
     async def schema_exists(conn: aiosqlite.Connection) -> bool:
         """
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import subprocess
+import sys
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -12,6 +16,15 @@ from cheap.db.sqlite.adapter import SqliteAdapter
 class TestSqliteAdapter:
     """Test suite for SqliteAdapter."""
 
+    def test_import_does_not_load_schema(self) -> None:
+        """Test that accessing SqliteAdapter leaves the schema and DAO modules unloaded."""
+        code = (
+            "import sys, cheap.db.sqlite as pkg; pkg.SqliteAdapter; "
+            "assert 'cheap.db.sqlite.schema' not in sys.modules; "
+            "assert 'cheap.db.sqlite.dao' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     @pytest.mark.asyncio
     async def test_create_memory_database(self) -> None:
         """Test creating an in-memory database."""
@@ -68,6 +81,69 @@ class TestSqliteAdapter:
 
             assert result[0] == 1  # Foreign keys enabled
 
+    @pytest.mark.asyncio
+    async def test_performance_pragmas_applied(self) -> None:
+        """Test that the connection init script also applies the performance settings."""
+        async with await SqliteAdapter.create(":memory:") as adapter:
+            conn = await adapter.get_connection()
+
+            cursor = await conn.execute("PRAGMA synchronous")
+            result = await cursor.fetchone()
+            await cursor.close()
+
+            assert result[0] == 1  # synchronous NORMAL
+
+    @pytest.mark.asyncio
+    async def test_execute_batch(self) -> None:
+        """Test that a batch runs on the same connection and transaction."""
+        async with await SqliteAdapter.create(":memory:") as adapter:
+            conn = await adapter.get_connection()
+            await conn.execute("CREATE TABLE t (x INTEGER)")
+
+            # Autocommit mode: nothing is pending until a transaction is begun
+            assert conn.isolation_level is None
+            assert not conn.in_transaction
+            await conn.execute("BEGIN")
+            await adapter.execute_batch([("INSERT INTO t (x) VALUES (?)", (i,)) for i in range(3)])
+            assert conn.in_transaction
+
+            await conn.rollback()
+            cursor = await conn.execute("SELECT COUNT(*) FROM t")
+            result = await cursor.fetchone()
+            await cursor.close()
+
+            assert result[0] == 0  # Batch was rolled back with the transaction
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_on_connection_thread(self) -> None:
+        """Test that a batch runs on aiosqlite's thread, serialised with other calls."""
+        async with await SqliteAdapter.create(":memory:") as adapter:
+            conn = await adapter.get_connection()
+            await conn.create_function("thread_id", 0, threading.get_ident)
+            await conn.execute("CREATE TABLE t (x INTEGER)")
+
+            batch = [("INSERT INTO t (x) VALUES (thread_id())", ())] * 100
+            _, cursor = await asyncio.gather(
+                adapter.execute_batch(batch), conn.execute("SELECT thread_id()")
+            )
+            row = await cursor.fetchone()
+            await cursor.close()
+
+            cursor = await conn.execute("SELECT DISTINCT x FROM t")
+            batch_threads = await cursor.fetchall()
+            await cursor.close()
+
+            assert row is not None
+            assert [tuple(r) for r in batch_threads] == [(row[0],)]
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_not_connected(self) -> None:
+        """Test executing a batch when not connected raises error."""
+        adapter = SqliteAdapter(":memory:")
+
+        with pytest.raises(RuntimeError, match="Not connected to database"):
+            await adapter.execute_batch([])
+
     @pytest.mark.asyncio
     async def test_init_schema_on_create(self) -> None:
         """Test initializing schema during adapter creation."""
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import sqlite3
 from collections.abc import AsyncGenerator
+from decimal import Decimal
 from uuid import uuid4
 
 import pytest
-from cheap.core.aspect_impl import AspectDefImpl
+from cheap.core.aspect_impl import AspectDefImpl, AspectImpl
 from cheap.core.catalog_impl import CatalogImpl
 from cheap.core.catalog_species import CatalogSpecies
+from cheap.core.entity_impl import EntityImpl
 from cheap.core.property_impl import PropertyDefImpl
 from cheap.core.property_type import PropertyType
 from cheap.db.sqlite.adapter import SqliteAdapter
-from cheap.db.sqlite.dao import SqliteDao
+from cheap.db.sqlite.dao import PROPERTY_VALUE_ROWS_PER_INSERT, SqliteDao
+from cheap.db.sqlite.schema import SECONDARY_INDEXES
 
 
 class TestSqliteDao:
@@ -111,6 +115,240 @@ class TestSqliteDao:
         assert loaded_age_prop.property_type == PropertyType.INTEGER
         assert not loaded_age_prop.is_nullable
 
+    @pytest.mark.asyncio
+    async def test_save_catalog_bulk(self, adapter: SqliteAdapter, dao: SqliteDao) -> None:
+        """Test that a bulk save writes the entities and leaves the secondary indexes in place."""
+        catalog_id = uuid4()
+        catalog = CatalogImpl(
+            global_id=catalog_id,
+            species=CatalogSpecies.SOURCE,
+            version="1.0.0",
+        )
+        aspect_def = AspectDefImpl(
+            name="person",
+            properties={"name": PropertyDefImpl(name="name", property_type=PropertyType.STRING)},
+        )
+        catalog.add_aspect_def(aspect_def)
+
+        entities = []
+        for i in range(10):
+            entity = EntityImpl()
+            aspect = AspectImpl(definition=aspect_def, entity=entity)
+            aspect.set_property("name", f"person{i}")
+            entity.add_aspect(aspect)
+            entities.append(entity)
+
+        await dao.save_catalog(catalog, entities=entities, bulk=True)
+
+        loaded = await dao.load_catalog(catalog_id)
+        assert set(loaded.aspect_defs["person"].properties) == {"name"}
+
+        conn = await adapter.get_connection()
+        cursor = await conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+        )
+        count = (await cursor.fetchone())[0]
+        await cursor.close()
+        assert count == len(SECONDARY_INDEXES)
+
+        cursor = await conn.execute("SELECT COUNT(*) FROM property_value")
+        assert (await cursor.fetchone())[0] == len(entities)
+        await cursor.close()
+
+    @pytest.mark.asyncio
+    async def test_resave_catalog_keeps_rows(self, adapter: SqliteAdapter, dao: SqliteDao) -> None:
+        """Test that saving a catalog again updates its rows in place."""
+        catalog = CatalogImpl(species=CatalogSpecies.SOURCE, version="1.0.0")
+        catalog.add_aspect_def(
+            AspectDefImpl(
+                name="person",
+                properties={
+                    "name": PropertyDefImpl(name="name", property_type=PropertyType.STRING)
+                },
+            )
+        )
+        await dao.save_catalog(catalog)
+
+        conn = await adapter.get_connection()
+        await conn.execute(
+            "INSERT INTO entity (id, catalog_id) VALUES (?, ?)",
+            (uuid4().bytes, catalog.global_id.bytes),
+        )
+        cursor = await conn.execute("SELECT id FROM property_def")
+        property_def_ids = await cursor.fetchall()
+        await cursor.close()
+
+        # Saving unchanged definitions again writes nothing
+        total_changes = conn.total_changes
+        await dao.save_catalog(catalog)
+        assert conn.total_changes == total_changes
+
+        catalog.version = "1.0.1"
+        await dao.save_catalog(catalog)
+
+        # Neither the catalog's entity nor the property def ids were replaced
+        cursor = await conn.execute("SELECT COUNT(*) FROM entity")
+        assert (await cursor.fetchone())[0] == 1
+        await cursor.close()
+        cursor = await conn.execute("SELECT id FROM property_def")
+        assert await cursor.fetchall() == property_def_ids
+        await cursor.close()
+
+        loaded = await dao.load_catalog(catalog.global_id)
+        assert loaded.version == "1.0.1"
+
+    @pytest.mark.asyncio
+    async def test_save_catalog_stamps_updated_at(self) -> None:
+        """Test that upserts set updated_at on changed rows of an audit schema."""
+        async with await SqliteAdapter.create(
+            ":memory:", init_schema=True, include_audit=True
+        ) as adapter:
+            dao = SqliteDao(adapter)
+            catalog = CatalogImpl(species=CatalogSpecies.SOURCE, version="1.0.0")
+            catalog.add_aspect_def(
+                AspectDefImpl(
+                    name="person",
+                    properties={
+                        "name": PropertyDefImpl(name="name", property_type=PropertyType.STRING)
+                    },
+                )
+            )
+            await dao.save_catalog(catalog)
+
+            # Backdate every row, and make the property def differ from the catalog's
+            conn = await adapter.get_connection()
+            await conn.execute("UPDATE catalog SET updated_at = '2000-01-01 00:00:00'")
+            await conn.execute("UPDATE aspect_def SET updated_at = '2000-01-01 00:00:00'")
+            await conn.execute(
+                "UPDATE property_def SET is_writable = 0, updated_at = '2000-01-01 00:00:00'"
+            )
+
+            await dao.save_catalog(catalog)
+
+            # Only the changed property def was updated and stamped
+            stamps = []
+            for table in ("catalog", "aspect_def", "property_def"):
+                cursor = await conn.execute(f"SELECT updated_at FROM {table}")
+                stamps.append((await cursor.fetchone())[0])
+                await cursor.close()
+            assert stamps[:2] == ["2000-01-01 00:00:00", "2000-01-01 00:00:00"]
+            assert stamps[2] > "2000-01-01 00:00:00"
+
+    @pytest.mark.asyncio
+    async def test_save_entities(self, adapter: SqliteAdapter, dao: SqliteDao) -> None:
+        """Test saving entities round-trips their property values."""
+        catalog = CatalogImpl(species=CatalogSpecies.SOURCE, version="1.0.0")
+        aspect_def = AspectDefImpl(
+            name="item",
+            properties={
+                "count": PropertyDefImpl(name="count", property_type=PropertyType.INTEGER),
+                "big": PropertyDefImpl(name="big", property_type=PropertyType.BIG_INTEGER),
+                "huge": PropertyDefImpl(name="huge", property_type=PropertyType.BIG_INTEGER),
+                "price": PropertyDefImpl(name="price", property_type=PropertyType.BIG_DECIMAL),
+                "ratio": PropertyDefImpl(name="ratio", property_type=PropertyType.FLOAT),
+                "active": PropertyDefImpl(name="active", property_type=PropertyType.BOOLEAN),
+                "label": PropertyDefImpl(name="label", property_type=PropertyType.STRING),
+                "data": PropertyDefImpl(name="data", property_type=PropertyType.BLOB),
+            },
+        )
+        catalog.add_aspect_def(aspect_def)
+
+        entity = EntityImpl()
+        aspect = AspectImpl(definition=aspect_def, entity=entity)
+        aspect.set_property("count", 42)
+        aspect.set_property("big", 2**63 - 1)
+        aspect.set_property("huge", 2**64 + 1)  # Overflows SQLite's 64-bit INTEGER
+        aspect.set_property("price", Decimal("12345678901234567890.123456789"))
+        aspect.set_property("ratio", 0.25)
+        aspect.set_property("active", True)
+        aspect.set_property("label", "widget")
+        aspect.set_property("data", b"\x00\x01binary")
+        entity.add_aspect(aspect)
+
+        await dao.save_catalog(catalog, entities=[entity])
+        # Re-saving replaces the values instead of adding to them
+        aspect.set_property("count", 43)
+        await dao.save_catalog(catalog, entities=[entity])
+
+        conn = await adapter.get_connection()
+        cursor = await conn.execute(
+            """
+            SELECT pd.name, pv.value_int, pv.value_real, pv.value_text, pv.value_binary
+            FROM property_value pv
+            JOIN property_def pd ON pd.id = pv.property_def_id
+            JOIN aspect a ON a.id = pv.aspect_id
+            WHERE a.entity_id = ?
+            """,
+            (entity.id.bytes,),
+        )
+        fetched = await cursor.fetchall()
+        await cursor.close()
+        rows = {row[0]: tuple(row[1:]) for row in fetched}
+
+        assert len(fetched) == len(rows)
+        assert rows == {
+            "count": (43, None, None, None),
+            "big": (2**63 - 1, None, None, None),
+            "huge": (None, None, str(2**64 + 1), None),
+            "price": (None, None, "12345678901234567890.123456789", None),
+            "ratio": (None, 0.25, None, None),
+            "active": (1, None, None, None),
+            "label": (None, None, "widget", None),
+            "data": (None, None, None, b"\x00\x01binary"),
+        }
+        assert Decimal(rows["price"][2]) == Decimal("12345678901234567890.123456789")
+        assert int(rows["huge"][2]) == 2**64 + 1
+
+    @pytest.mark.asyncio
+    async def test_save_entities_multi_row_insert(
+        self, adapter: SqliteAdapter, dao: SqliteDao
+    ) -> None:
+        """Test saving more property values than one multi-row INSERT holds."""
+        catalog = CatalogImpl(species=CatalogSpecies.SOURCE, version="1.0.0")
+        aspect_def = AspectDefImpl(
+            name="counter",
+            properties={"n": PropertyDefImpl(name="n", property_type=PropertyType.INTEGER)},
+        )
+        catalog.add_aspect_def(aspect_def)
+
+        entities = []
+        for i in range(PROPERTY_VALUE_ROWS_PER_INSERT * 2 + 3):
+            entity = EntityImpl()
+            aspect = AspectImpl(definition=aspect_def, entity=entity)
+            aspect.set_property("n", i)
+            entity.add_aspect(aspect)
+            entities.append(entity)
+
+        await dao.save_catalog(catalog, entities=entities)
+
+        conn = await adapter.get_connection()
+        cursor = await conn.execute(
+            """
+            SELECT a.entity_id, pv.value_int
+            FROM property_value pv
+            JOIN aspect a ON a.id = pv.aspect_id
+            """
+        )
+        values = {bytes(row[0]): row[1] for row in await cursor.fetchall()}
+        await cursor.close()
+
+        assert values == {entity.id.bytes: i for i, entity in enumerate(entities)}
+
+    @pytest.mark.asyncio
+    async def test_save_entities_rolls_back(self, adapter: SqliteAdapter, dao: SqliteDao) -> None:
+        """Test that a failed entity save rolls back the whole catalog save."""
+        catalog = CatalogImpl(species=CatalogSpecies.SOURCE, version="1.0.0")
+        # The aspect's definition is not part of the catalog, so it is not saved
+        aspect_def = AspectDefImpl(name="orphan", properties={})
+        entity = EntityImpl()
+        entity.add_aspect(AspectImpl(definition=aspect_def, entity=entity))
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await dao.save_catalog(catalog, entities=[entity])
+
+        with pytest.raises(ValueError, match="Catalog not found"):
+            await dao.load_catalog(catalog.global_id)
+
     @pytest.mark.asyncio
     async def test_delete_catalog(self, adapter: SqliteAdapter, dao: SqliteDao) -> None:
         """Test deleting a catalog."""
@@ -170,3 +408,9 @@ class TestSqliteDao:
 
         for prop_type in all_types:
             assert prop_type in PROPERTY_TYPE_TO_DB
+
+        # Both mappings are read-only
+        with pytest.raises(TypeError):
+            PROPERTY_TYPE_TO_DB[PropertyType.INTEGER] = "XXX"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            DB_TO_PROPERTY_TYPE["XXX"] = PropertyType.INTEGER  # type: ignore[index]
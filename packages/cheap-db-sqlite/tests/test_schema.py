@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import tempfile
+from pathlib import Path
+from uuid import UUID
+
 import aiosqlite
 import pytest
 from cheap.db.sqlite.adapter import SqliteAdapter
-from cheap.db.sqlite.schema import SqliteSchema
+from cheap.db.sqlite.schema import SECONDARY_INDEX_COLUMNS, SqliteSchema
 
 
 class TestSqliteSchema:
@@ -30,28 +34,31 @@ class TestSqliteSchema:
             cursor = await conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
             )
-            tables = [row[0] for row in await cursor.fetchall()]
+            tables = {row[0] for row in await cursor.fetchall()}
             await cursor.close()
 
-            expected_tables = [
-                "aspect",
-                "aspect_def",
-                "catalog",
-                "catalog_aspect_def",
-                "entity",
-                "hierarchy",
-                "hierarchy_aspect_map",
-                "hierarchy_def",
-                "hierarchy_entity_directory",
-                "hierarchy_entity_list",
-                "hierarchy_entity_set",
-                "hierarchy_entity_tree_node",
-                "property_def",
-                "property_value",
-            ]
-
-            for table in expected_tables:
-                assert table in tables, f"Table {table} not found"
+            expected_tables = frozenset(
+                {
+                    "aspect",
+                    "aspect_def",
+                    "catalog",
+                    "catalog_aspect_def",
+                    "entity",
+                    "hierarchy",
+                    "hierarchy_aspect_map",
+                    "hierarchy_def",
+                    "hierarchy_entity_directory",
+                    "hierarchy_entity_list",
+                    "hierarchy_entity_set",
+                    "hierarchy_entity_tree_node",
+                    "property_def",
+                    "property_value",
+                }
+            )
+
+            assert expected_tables <= tables, (
+                f"Tables not found: {sorted(expected_tables - tables)}"
+            )
 
     @pytest.mark.asyncio
     async def test_create_schema_with_audit(self) -> None:
@@ -64,19 +71,33 @@ class TestSqliteSchema:
 
             # Check that audit columns exist in aspect_def
             cursor = await conn.execute("PRAGMA table_info(aspect_def)")
-            columns = [row[1] for row in await cursor.fetchall()]
+            columns = {row[1] for row in await cursor.fetchall()}
             await cursor.close()
 
-            assert "created_at" in columns
-            assert "updated_at" in columns
+            assert {"created_at", "updated_at"} <= columns
 
-            # Check that triggers exist
+            # updated_at is maintained by the DAO, not by triggers
             cursor = await conn.execute("SELECT name FROM sqlite_master WHERE type='trigger'")
-            triggers = [row[0] for row in await cursor.fetchall()]
+            triggers = await cursor.fetchall()
+            await cursor.close()
+
+            assert triggers == []
+
+    @pytest.mark.asyncio
+    async def test_secondary_indexes(self) -> None:
+        """Test that the declared secondary indexes are all the schema's own indexes."""
+        async with await SqliteAdapter.create(":memory:") as adapter:
+            conn = await adapter.get_connection()
+            await SqliteSchema.create_schema(conn, include_audit=True)
+
+            # Indexes SQLite creates for primary keys and UNIQUE have no SQL
+            cursor = await conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND sql IS NOT NULL"
+            )
+            indexes = {row[0] for row in await cursor.fetchall()}
             await cursor.close()
 
-            assert "update_aspect_def_updated_at" in triggers
-            assert "update_catalog_updated_at" in triggers
+            assert indexes == set(SECONDARY_INDEX_COLUMNS)
 
     @pytest.mark.asyncio
     async def test_drop_schema(self) -> None:
@@ -142,3 +163,58 @@ class TestSqliteSchema:
                     """
                 )
                 await conn.commit()
+
+    @pytest.mark.asyncio
+    async def test_create_schema_applies_performance_pragmas(self) -> None:
+        """Test that schema creation switches the connection to WAL and friends."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            async with aiosqlite.connect(Path(tmpdir) / "test.db", isolation_level=None) as conn:
+                await SqliteSchema.create_schema(conn)
+
+                results = {}
+                for pragma in ("journal_mode", "synchronous", "temp_store", "cache_size"):
+                    cursor = await conn.execute(f"PRAGMA {pragma}")
+                    results[pragma] = (await cursor.fetchone())[0]
+                    await cursor.close()
+
+                # synchronous NORMAL = 1, temp_store MEMORY = 2
+                assert results == {
+                    "journal_mode": "wal",
+                    "synchronous": 1,
+                    "temp_store": 2,
+                    "cache_size": -64000,
+                }
+
+    @pytest.mark.asyncio
+    async def test_migrate_uuids_to_blob(self) -> None:
+        """Test converting UUIDs stored as text to 16-byte BLOBs."""
+        async with await SqliteAdapter.create(":memory:", init_schema=True) as adapter:
+            conn = await adapter.get_connection()
+
+            # Rows as written by earlier versions, with UUIDs as text
+            catalog_id = "550e8400-e29b-41d4-a716-446655440000"
+            aspect_def_id = "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
+            await conn.execute(
+                "INSERT INTO catalog (id, species, version) VALUES (?, 'SOURCE', '1.0')",
+                (catalog_id,),
+            )
+            await conn.execute(
+                "INSERT INTO aspect_def (id, name) VALUES (?, 'test_aspect')", (aspect_def_id,)
+            )
+            await conn.execute(
+                "INSERT INTO catalog_aspect_def (catalog_id, aspect_def_id) VALUES (?, ?)",
+                (catalog_id, aspect_def_id),
+            )
+
+            await SqliteSchema.migrate_uuids_to_blob(conn)
+            # Already migrated values are left alone
+            await SqliteSchema.migrate_uuids_to_blob(conn)
+
+            cursor = await conn.execute("SELECT catalog_id, aspect_def_id FROM catalog_aspect_def")
+            row = await cursor.fetchone()
+            await cursor.close()
+            assert row == (UUID(catalog_id).bytes, UUID(aspect_def_id).bytes)
+
+            cursor = await conn.execute("PRAGMA foreign_key_check")
+            assert await cursor.fetchall() == []
+            await cursor.close()
@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import TYPE_CHECKING, Any
 
 import orjson
+from cheap.core.aspect import Aspect, AspectDef
+from cheap.core.aspect_impl import AspectDefImpl, AspectImpl
+from cheap.core.catalog import Catalog, CatalogDef, HierarchyDef
+from cheap.core.catalog_impl import CatalogDefImpl, CatalogImpl, HierarchyDefImpl
+from cheap.core.entity_impl import EntityImpl
+from cheap.core.property import Property, PropertyDef
+from cheap.core.property_impl import PropertyDefImpl, PropertyImpl
 
 if TYPE_CHECKING:
-    from cheap.core.aspect import Aspect, AspectDef
-    from cheap.core.catalog import Catalog, CatalogDef, HierarchyDef
+    from collections.abc import Callable
+
     from cheap.core.entity import Entity
     from cheap.core.hierarchy import Hierarchy
-    from cheap.core.property import Property, PropertyDef
+
+# orjson options for compact and indented output, computed once rather than on
+# every call. OPT_SORT_KEYS keeps the output deterministic. The implementation
+# classes are dataclasses, which orjson would otherwise encode field by field
+# instead of handing them to _default_encoder; other dataclasses are passed
+# through too, so _default_encoder encodes those by their fields itself.
+_OPT_COMPACT = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_UUID | orjson.OPT_PASSTHROUGH_DATACLASS
+_OPT_PRETTY = _OPT_COMPACT | orjson.OPT_INDENT_2
 
 
 def _default_encoder(obj: Any) -> Any:
     """
-    Custom encoder for types not natively supported by orjson.
+    Encode a CHEAP object nested inside the one being serialized.
+
+    Passed to orjson as its ``default`` callback. The serializers leave nested
+    definitions in place, mostly as the live mappings that hold them (a
+    catalog's aspect defs, an aspect def's property defs), and orjson calls
+    this for each one as it reaches it. So no intermediate tree of dicts is
+    built for the whole object before encoding.
 
-    orjson natively handles: UUID, datetime, date, time, bytes
-    This function handles additional CHEAP-specific types.
+    Any other dataclass, such as a property value, is encoded as a dict of its
+    fields, as orjson itself would without OPT_PASSTHROUGH_DATACLASS. Field
+    values are left to orjson, so CHEAP objects inside them come back here.
 
     Args:
         obj: Object to encode.
@@ -30,11 +52,15 @@ def _default_encoder(obj: Any) -> Any:
     Raises:
         TypeError: If the object type cannot be serialized.
     """
-    # orjson already handles UUID, datetime, bytes automatically
-    # We just need to handle our custom types by converting them to dicts
-    if hasattr(obj, "__dict__"):
-        return obj.__dict__
-    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    serializer = _SERIALIZERS.get(type(obj))
+    if serializer is None:
+        try:
+            serializer = _find_serializer(obj)
+        except TypeError:
+            if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+                return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+            raise
+    return serializer(obj)
 
 
 class CheapJsonSerializer:
@@ -78,14 +104,11 @@ class CheapJsonSerializer:
         Raises:
             TypeError: If the object type is not supported.
         """
-        options = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_UUID
-
-        if pretty:
-            options |= orjson.OPT_INDENT_2
-
         # Dispatch to appropriate serializer based on type
         data = _serialize_object(obj)
-        return orjson.dumps(data, option=options)
+        return orjson.dumps(
+            data, default=_default_encoder, option=_OPT_PRETTY if pretty else _OPT_COMPACT
+        )
 
     @staticmethod
     def to_json_str(
@@ -118,57 +141,48 @@ def _serialize_object(obj: Any) -> dict[str, Any]:
     """
     Dispatch to appropriate serializer based on object type.
 
+    The concrete implementation classes are looked up by exact type in
+    _SERIALIZERS. Other types go through _find_serializer.
+
     Args:
         obj: Object to serialize.
 
     Returns:
-        Dictionary representation ready for JSON serialization.
+        Dictionary representation; nested CHEAP objects are left for
+        _default_encoder.
+
+    Raises:
+        TypeError: If object type is not supported.
+    """
+    serializer = _SERIALIZERS.get(type(obj))
+    if serializer is None:
+        serializer = _find_serializer(obj)
+    return serializer(obj)
+
+
+def _find_serializer(obj: Any) -> Callable[[Any], dict[str, Any]]:
+    """
+    Find the serializer for an object whose type is not in _SERIALIZERS.
+
+    Subclasses of the implementation classes are checked first and remembered
+    in _SUBCLASS_SERIALIZERS, leaving _SERIALIZERS itself unchanged. Protocol
+    matches are structural, so they are checked again for every object rather
+    than cached by type.
 
     Raises:
         TypeError: If object type is not supported.
     """
-    from cheap.core.aspect import Aspect, AspectDef
-    from cheap.core.aspect_impl import AspectDefImpl, AspectImpl
-    from cheap.core.catalog import Catalog, CatalogDef, HierarchyDef
-    from cheap.core.catalog_impl import CatalogDefImpl, CatalogImpl, HierarchyDefImpl
-    from cheap.core.entity_impl import EntityImpl
-    from cheap.core.property import Property, PropertyDef
-    from cheap.core.property_impl import PropertyDefImpl, PropertyImpl
-
-    # Check concrete implementations first (more specific), then protocols
-    if isinstance(obj, PropertyDefImpl):
-        return _serialize_property_def(obj)
-    elif isinstance(obj, PropertyImpl):
-        return _serialize_property(obj)
-    elif isinstance(obj, AspectDefImpl):
-        return _serialize_aspect_def(obj)
-    elif isinstance(obj, AspectImpl):
-        return _serialize_aspect(obj)
-    elif isinstance(obj, EntityImpl):
-        return _serialize_entity(obj)
-    elif isinstance(obj, HierarchyDefImpl):
-        return _serialize_hierarchy_def(obj)
-    elif isinstance(obj, CatalogDefImpl):
-        return _serialize_catalog_def(obj)
-    elif isinstance(obj, CatalogImpl):
-        return _serialize_catalog(obj)
-    # Fallback to protocol checks
-    elif isinstance(obj, PropertyDef):
-        return _serialize_property_def(obj)
-    elif isinstance(obj, Property):
-        return _serialize_property(obj)
-    elif isinstance(obj, AspectDef):
-        return _serialize_aspect_def(obj)
-    elif isinstance(obj, Aspect):
-        return _serialize_aspect(obj)
-    elif isinstance(obj, HierarchyDef):
-        return _serialize_hierarchy_def(obj)
-    elif isinstance(obj, CatalogDef):
-        return _serialize_catalog_def(obj)
-    elif isinstance(obj, Catalog):
-        return _serialize_catalog(obj)
-    else:
-        raise TypeError(f"Unsupported type for serialization: {type(obj)}")
+    serializer = _SUBCLASS_SERIALIZERS.get(type(obj))
+    if serializer is not None:
+        return serializer
+    for cls, serializer in _SERIALIZERS.items():
+        if isinstance(obj, cls):
+            _SUBCLASS_SERIALIZERS[type(obj)] = serializer
+            return serializer
+    for protocol, serializer in _PROTOCOL_SERIALIZERS:
+        if isinstance(obj, protocol):
+            return serializer
+    raise TypeError(f"Unsupported type for serialization: {type(obj)}")
 
 
 def _serialize_property_def(prop_def: PropertyDef) -> dict[str, Any]:
@@ -195,7 +209,7 @@ def _serialize_property_def(prop_def: PropertyDef) -> dict[str, Any]:
 def _serialize_property(prop: Property) -> dict[str, Any]:
     """Serialize a Property to a dictionary."""
     return {
-        "def": _serialize_property_def(prop.definition),
+        "def": prop.definition,
         "value": prop.value,
     }
 
@@ -205,10 +219,7 @@ def _serialize_aspect_def(aspect_def: AspectDef) -> dict[str, Any]:
     result: dict[str, Any] = {
         "name": aspect_def.name,
         "id": str(aspect_def.id),
-        "properties": {
-            name: _serialize_property_def(prop_def)
-            for name, prop_def in aspect_def.properties.items()
-        },
+        "properties": aspect_def.properties,
     }
 
     # Include optional fields
@@ -292,14 +303,8 @@ def _serialize_hierarchy(hierarchy: Hierarchy) -> dict[str, Any]:
 def _serialize_catalog_def(catalog_def: CatalogDef) -> dict[str, Any]:
     """Serialize a CatalogDef to a dictionary."""
     return {
-        "aspectDefs": {
-            name: _serialize_aspect_def(aspect_def)
-            for name, aspect_def in catalog_def.aspect_defs.items()
-        },
-        "hierarchyDefs": {
-            name: _serialize_hierarchy_def(hierarchy_def)
-            for name, hierarchy_def in catalog_def.hierarchy_defs.items()
-        },
+        "aspectDefs": catalog_def.aspect_defs,
+        "hierarchyDefs": catalog_def.hierarchy_defs,
     }
 
 
@@ -316,12 +321,38 @@ def _serialize_catalog(catalog: Catalog) -> dict[str, Any]:
         "id": str(catalog_id),
         "species": catalog.species.value,
         "version": catalog.version,
-        "aspectDefs": {
-            name: _serialize_aspect_def(aspect_def) for name, aspect_def in aspect_defs.items()
-        },
+        "aspectDefs": aspect_defs,
         "hierarchies": {
             name: _serialize_hierarchy(hierarchy) for name, hierarchy in hierarchies.items()
         },
     }
 
     return result
+
+
+# Serializer for each concrete implementation class, in the order subclasses
+# are matched against them
+_SERIALIZERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    PropertyDefImpl: _serialize_property_def,
+    PropertyImpl: _serialize_property,
+    AspectDefImpl: _serialize_aspect_def,
+    AspectImpl: _serialize_aspect,
+    EntityImpl: _serialize_entity,
+    HierarchyDefImpl: _serialize_hierarchy_def,
+    CatalogDefImpl: _serialize_catalog_def,
+    CatalogImpl: _serialize_catalog,
+}
+
+# Serializers found for subclasses of the implementation classes, by exact type
+_SUBCLASS_SERIALIZERS: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+# Fallback for other implementations of the protocols, in match order
+_PROTOCOL_SERIALIZERS: tuple[tuple[type, Callable[[Any], dict[str, Any]]], ...] = (
+    (PropertyDef, _serialize_property_def),
+    (Property, _serialize_property),
+    (AspectDef, _serialize_aspect_def),
+    (Aspect, _serialize_aspect),
+    (HierarchyDef, _serialize_hierarchy_def),
+    (CatalogDef, _serialize_catalog_def),
+    (Catalog, _serialize_catalog),
+)
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from uuid import UUID, uuid4
 
 import orjson
+import pytest
 from cheap.core.aspect_impl import AspectDefImpl, AspectImpl
 from cheap.core.catalog_impl import CatalogDefImpl, CatalogImpl, HierarchyDefImpl
 from cheap.core.catalog_species import CatalogSpecies
 from cheap.core.entity_impl import EntityImpl
 from cheap.core.hierarchy_type import HierarchyType
-from cheap.core.property_impl import PropertyDefImpl
+from cheap.core.property_impl import PropertyDefImpl, PropertyImpl
 from cheap.core.property_type import PropertyType
 from cheap.json.deserializer import CheapJsonDeserializer
-from cheap.json.serializer import CheapJsonSerializer
+from cheap.json.serializer import _SERIALIZERS, CheapJsonSerializer
 
 
 class TestPropertyDefSerialization:
@@ -310,6 +312,49 @@ class TestPrettyPrinting:
         assert "  " in json_pretty  # Indentation
 
 
+class TestDispatch:
+    """Test the choice of serializer for an object."""
+
+    def test_serialize_subclass(self) -> None:
+        """Test that a subclass is serialized like its implementation class."""
+
+        class NamedPropertyDef(PropertyDefImpl):
+            pass
+
+        prop_def = NamedPropertyDef(name="age", property_type=PropertyType.INTEGER)
+
+        # Twice: the second call uses the serializer remembered for the subclass
+        for _ in range(2):
+            data = orjson.loads(CheapJsonSerializer.to_json(prop_def))
+            assert data == {"name": "age", "type": "INTEGER"}
+
+        # The registry of implementation classes is left as it was
+        assert NamedPropertyDef not in _SERIALIZERS
+
+    def test_serialize_dataclass_value(self) -> None:
+        """Test that a dataclass property value is encoded by its fields."""
+
+        @dataclass
+        class Point:
+            x: int
+            y: int
+
+        # The value setter only accepts the property type's Python type, so the
+        # value is stored directly, as a caller building values itself may
+        prop = PropertyImpl(
+            definition=PropertyDefImpl(name="point", property_type=PropertyType.TEXT),
+            _value=Point(x=1, y=2),  # type: ignore[arg-type]
+        )
+
+        data = orjson.loads(CheapJsonSerializer.to_json(prop))
+        assert data["value"] == {"x": 1, "y": 2}
+
+    def test_serialize_unsupported_type(self) -> None:
+        """Test that an unsupported object raises TypeError."""
+        with pytest.raises(TypeError, match="Unsupported type"):
+            CheapJsonSerializer.to_json(object())  # type: ignore[arg-type]
+
+
 class TestUUIDSerialization:
     """Test UUID serialization."""
 